@@ -0,0 +1,243 @@
+"""
+Benchmarks for `countrycode` conversions.
+
+Runs offline with the standard library only; Polars and pandas cases are
+included when those libraries are installed. Results are written as JSON so
+that runs from different commits can be compared:
+
+    python benchmarks/bench_countrycode.py --output before.json
+    python benchmarks/bench_countrycode.py --output after.json
+    python benchmarks/bench_countrycode.py --compare before.json after.json
+
+Each case is identified by a name built from its parameters:
+
+    engine      exact (iso3c -> cown) or regex (country.name -> iso3c)
+    input       scalar, list, polars, or pandas
+    codelist    default or custom (a dict with the same columns)
+    state       cold (all caches cleared before each call) or warm
+    size        number of input values
+    distinct    number of distinct input values
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from countrycode import countrycode  # noqa: E402
+from countrycode.countrycode import prepare_codelist  # noqa: E402
+
+# The module rather than the package attribute, which is the function itself
+countrycode_module = sys.modules["countrycode.countrycode"]
+
+# Cache controls and precomputed artifacts only exist in later versions; the
+# script must still time older commits so that runs can be compared
+clear_codelist_cache = getattr(countrycode_module, "clear_codelist_cache", None)
+clear_lookup_cache = getattr(countrycode_module, "clear_lookup_cache", None)
+ARTIFACT_GLOBALS = ["_aliases", "_matrix"]
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+ENGINES = {
+    "exact": ("iso3c", "cown", "iso3c"),
+    "regex": ("country.name", "iso3c", "country.name.en"),
+}
+
+
+def make_values(column, size, distinct):
+    """
+    `size` values cycling through `distinct` values of `column`, padded with
+    values that match nothing when the column has fewer distinct values.
+    """
+    pool = [value for value in prepare_codelist(None)[column] if value is not None]
+    pool = pool[:distinct] + [f"Unknown {i}" for i in range(distinct - len(pool))]
+    return [pool[i % distinct] for i in range(size)]
+
+
+def make_input(kind, values):
+    if kind == "scalar":
+        return values[0]
+    if kind == "polars":
+        return pl.Series("source", values)
+    if kind == "pandas":
+        return pd.Series(values, name="source")
+    return values
+
+
+def make_codelist(kind, engine):
+    if kind == "default":
+        return None
+    origin, destination, _ = ENGINES[engine]
+    origin = "country.name.en.regex" if origin == "country.name" else origin
+    data = prepare_codelist(None)
+    return {origin: list(data[origin]), destination: list(data[destination])}
+
+
+def clear_caches():
+    """
+    Reset every process-wide cache that the installed version has, including
+    the precomputed artifacts loaded on first use.
+    """
+    if clear_codelist_cache is not None:
+        clear_codelist_cache()
+    if clear_lookup_cache is not None:
+        clear_lookup_cache()
+    for name in ARTIFACT_GLOBALS:
+        if hasattr(countrycode_module, name):
+            setattr(countrycode_module, name, None)
+
+
+def time_case(call, state, repeat):
+    timings = []
+    if state == "warm":
+        call()
+    for _ in range(repeat):
+        if state == "cold":
+            clear_caches()
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def iter_cases(quick):
+    sizes = [1, 1_000, 100_000] if not quick else [1, 1_000]
+    distincts = [10, 1_000]
+    inputs = ["scalar", "list"]
+    if pl is not None:
+        inputs.append("polars")
+    if pd is not None:
+        inputs.append("pandas")
+
+    for engine in ENGINES:
+        for input_kind in inputs:
+            for codelist in ["default", "custom"]:
+                for state in ["cold", "warm"]:
+                    for size in [1] if input_kind == "scalar" else sizes[1:]:
+                        for distinct in distincts:
+                            if input_kind == "scalar" and distinct != distincts[0]:
+                                continue
+                            yield {
+                                "engine": engine,
+                                "input": input_kind,
+                                "codelist": codelist,
+                                "state": state,
+                                "size": size,
+                                "distinct": min(distinct, size),
+                            }
+
+
+def case_name(case):
+    return "{engine}-{input}-{codelist}-{state}-n{size}-d{distinct}".format(**case)
+
+
+def matches(name, pattern):
+    """
+    Whether every `-`-separated part of `pattern` is a part of the case
+    `name`, so that `n1000-d10` selects `...-n1000-d10` but not `-d100`.
+    """
+    return set(pattern.split("-")) <= set(name.split("-"))
+
+
+def run(quick=False, repeat=5, pattern=None):
+    results = []
+    for case in iter_cases(quick):
+        name = case_name(case)
+        if pattern and not matches(name, pattern):
+            continue
+        origin, destination, column = ENGINES[case["engine"]]
+        values = make_values(column, case["size"], case["distinct"])
+        sourcevar = make_input(case["input"], values)
+        custom_dict = make_codelist(case["codelist"], case["engine"])
+        if custom_dict is not None and origin == "country.name":
+            origin = "country.name.en.regex"
+
+        def call():
+            countrycode(sourcevar, origin, destination, custom_dict=custom_dict)
+
+        # Cold calls with the full regex table are slow; fewer repeats suffice
+        n = max(1, repeat // 2) if case["state"] == "cold" else repeat
+        timings = time_case(call, case["state"], n)
+        result = dict(case, name=name, repeat=n)
+        result["min_s"] = min(timings)
+        result["median_s"] = statistics.median(timings)
+        result["per_value_ns"] = result["min_s"] / case["size"] * 1e9
+        results.append(result)
+        print(f"{name:<45} {result['min_s'] * 1e3:>10.3f} ms", flush=True)
+    return results
+
+
+def metadata():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "polars": getattr(pl, "__version__", None),
+        "pandas": getattr(pd, "__version__", None),
+    }
+
+
+def compare(before_path, after_path):
+    with open(before_path) as f:
+        before = {r["name"]: r for r in json.load(f)["results"]}
+    with open(after_path) as f:
+        after = {r["name"]: r for r in json.load(f)["results"]}
+    print(f"{'case':<45} {'before ms':>10} {'after ms':>10} {'ratio':>7}")
+    for name, result in after.items():
+        if name not in before:
+            continue
+        old, new = before[name]["min_s"], result["min_s"]
+        print(f"{name:<45} {old * 1e3:>10.3f} {new * 1e3:>10.3f} {new / old:>7.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--quick", action="store_true", help="skip the largest inputs")
+    parser.add_argument("--repeat", type=int, default=5, help="timed calls per case")
+    parser.add_argument(
+        "--filter",
+        help="only run cases with all these '-'-separated name parts, e.g. regex-warm",
+    )
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="compare two JSON files"
+    )
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    results = run(quick=args.quick, repeat=args.repeat, pattern=args.filter)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"metadata": metadata(), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
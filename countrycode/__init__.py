@@ -1 +1,25 @@
-from .countrycode import codelist, countrycode  # noqa
+from .countrycode import (  # noqa
+    Converter,
+    acountrycode,
+    clear_codelist_cache,
+    clear_lookup_cache,
+    codelist_cache_info,
+    countrycode,
+    iter_convert,
+    locate,
+    set_regex_memo,
+    take,
+    _public_codelist,
+)
+
+
+def __getattr__(name):
+    # The default codelist is loaded on first access, for backwards compatibility
+    if name == "codelist":
+        return _public_codelist()
+    # Imported on first use, as most programs do not need fuzzy matching
+    if name == "fuzzy_countrycode":
+        from .fuzzy import fuzzy_countrycode
+
+        return fuzzy_countrycode
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,81 @@
+"""
+Precomputed alias tables for the regex origins.
+
+Resolving a name against the regex origins means searching it with many
+patterns. The build step (`csv2pickle.py`) resolves every name of the
+codelist's name columns once, and `write_aliases` stores the results in
+`data/aliases.json`, shipped alongside the codelist:
+
+    {"version": 1, "origins": {origin: {"digest": ..., "rows": {key: row}}}}
+
+For each regex origin, `rows` maps the `_name_key` of a name to the codelist
+row it resolves to (or null when it matches nothing). `digest` identifies the
+origin column the table was built from, so that the table is ignored for any
+other codelist. At runtime, names found in the table resolve with one dict
+lookup, without compiling a single regex.
+"""
+
+import json
+
+from .countrycode import (
+    _ALIASES_VERSION,
+    _REGEX_ORIGINS,
+    _RegexMatcher,
+    _compile_rows,
+    _digest,
+    _name_key,
+    _name_shortcut,
+)
+
+# Name columns, in any language, whose entries are kept when the regex of
+# their own row is the only one that matches them
+ALIAS_COLUMN_PREFIXES = ("cldr.name.", "un.name.", "iso.name.")
+ALIAS_COLUMNS = ("cow.name", "p4.name", "vdem.name")
+
+
+def alias_columns(codelist):
+    """
+    Names of the columns of `codelist` that aliases are drawn from.
+    """
+    return [
+        column
+        for column in codelist
+        if column.startswith(ALIAS_COLUMN_PREFIXES) or column in ALIAS_COLUMNS
+    ]
+
+
+def build_aliases(codelist):
+    """
+    Build the alias tables of every regex origin of `codelist`.
+
+    Each table holds the canonical names of the origin's language, resolved
+    with first-match-wins semantics, plus the entries of `alias_columns` that
+    are matched by the regex of their own row and by no other regex.
+
+    Returns:
+    dict: The content of `data/aliases.json`, see the module docstring.
+    """
+    columns = alias_columns(codelist)
+    origins = {}
+    for origin in _REGEX_ORIGINS:
+        if origin not in codelist:
+            continue
+        matcher = _RegexMatcher(_compile_rows(origin, codelist))
+        rows = _name_shortcut(matcher, origin, codelist)
+        for column in columns:
+            for row, name in enumerate(codelist[column]):
+                if not isinstance(name, str):
+                    continue
+                key = _name_key(name)
+                if key not in rows and matcher.match_all(name) == [row]:
+                    rows[key] = row
+        origins[origin] = {"digest": _digest(codelist[origin]), "rows": rows}
+    return {"version": _ALIASES_VERSION, "origins": origins}
+
+
+def write_aliases(codelist, path):
+    """
+    Write the alias tables of `codelist` to `path`, as JSON.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(build_aliases(codelist), f, ensure_ascii=False, sort_keys=True)
@@ -0,0 +1,264 @@
+"""
+Command line interface: convert a column of a CSV, TSV, Parquet or NDJSON file.
+
+    countrycode data.csv --column country --origin country.name --destination iso3c \
+        --output converted.csv
+
+The file is processed in chunks, so memory use does not grow with its size.
+When polars is installed, files are read with its lazy scanners and written
+with its streaming sinks; otherwise CSV, TSV and NDJSON files are streamed
+with the standard library.
+"""
+
+import argparse
+import csv
+import json
+import sys
+from collections import deque
+from pathlib import Path
+
+from .countrycode import (
+    _import_polars,
+    _resolve_arguments,
+    countrycode,
+    iter_convert,
+)
+
+FORMATS = {
+    ".csv": "csv",
+    ".tsv": "tsv",
+    ".tab": "tsv",
+    ".parquet": "parquet",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+
+
+def _infer_format(path, option):
+    if option:
+        return option
+    try:
+        return FORMATS[Path(path).suffix.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Cannot infer the format of `{path}`. Please use a known extension "
+            f"({', '.join(FORMATS)}) or pass --format."
+        )
+
+
+def _numeric_origin(origin, destination, custom_dict):
+    """
+    Whether the origin column holds integers, in which case digit-only values
+    read from text files are compared as integers.
+    """
+    origin, _, codelist, _ = _resolve_arguments(origin, destination, custom_dict)
+    return any(isinstance(value, int) for value in codelist[origin])
+
+
+def _stream_delimited(source, output, args, convert, delimiter):
+    reader = csv.reader(source, delimiter=delimiter)
+    header = next(reader, None)
+    if header is None:
+        raise ValueError("The input file is empty.")
+    if args.column not in header:
+        raise ValueError(f"Column `{args.column}` not found in the input file.")
+    index = header.index(args.column)
+    if args.into in header:
+        target = header.index(args.into)
+    else:
+        target = len(header)
+        header = header + [args.into]
+
+    writer = csv.writer(output, delimiter=delimiter, lineterminator="\n")
+    writer.writerow(header)
+
+    # Rows wait here until their converted value comes out of the stream
+    rows = deque()
+
+    def values():
+        for row in reader:
+            row += [""] * (len(header) - len(row))
+            rows.append(row)
+            yield row[index]
+
+    for value in convert(values()):
+        row = rows.popleft()
+        row[target] = "" if value is None else value
+        writer.writerow(row)
+
+
+def _stream_ndjson(source, output, args, convert):
+    records = deque()
+
+    def values():
+        for line in source:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if args.column not in record:
+                raise ValueError(f"Column `{args.column}` not found in record: {line}")
+            records.append(record)
+            yield record[args.column]
+
+    for value in convert(values()):
+        record = records.popleft()
+        record[args.into] = value
+        output.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def _run_python(args, input_format, output_format):
+    if "parquet" in (input_format, output_format):
+        raise ValueError("Reading or writing Parquet files requires polars.")
+    if input_format != output_format:
+        raise ValueError(
+            "Converting between file formats requires polars. "
+            f"Got `{input_format}` input and `{output_format}` output."
+        )
+
+    numeric = _numeric_origin(args.origin, args.destination, args.custom_dict)
+
+    def parse(value):
+        if value == "":
+            return None
+        if numeric and isinstance(value, str) and value.isdigit():
+            return int(value)
+        return value
+
+    def convert(values):
+        return iter_convert(
+            (parse(value) for value in values),
+            args.origin,
+            args.destination,
+            custom_dict=args.custom_dict,
+            chunk_size=args.chunk_size,
+        )
+
+    output = (
+        sys.stdout
+        if args.output in (None, "-")
+        else open(args.output, "w", newline="", encoding="utf-8")
+    )
+    try:
+        with open(args.input, newline="", encoding="utf-8") as source:
+            if input_format == "ndjson":
+                _stream_ndjson(source, output, args, convert)
+            else:
+                delimiter = "\t" if input_format == "tsv" else ","
+                _stream_delimited(source, output, args, convert, delimiter)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+def _run_polars(args, input_format, output_format, pl):
+    if input_format == "parquet":
+        lf = pl.scan_parquet(args.input)
+    elif input_format == "ndjson":
+        lf = pl.scan_ndjson(args.input)
+    else:
+        lf = pl.scan_csv(args.input, separator="\t" if input_format == "tsv" else ",")
+
+    if args.column not in lf.collect_schema().names():
+        raise ValueError(f"Column `{args.column}` not found in the input file.")
+    expr = countrycode(
+        pl.col(args.column), args.origin, args.destination, custom_dict=args.custom_dict
+    )
+    lf = lf.with_columns(expr.alias(args.into))
+
+    separator = "\t" if output_format == "tsv" else ","
+    if args.output in (None, "-"):
+        df = lf.collect()
+        if output_format == "ndjson":
+            sys.stdout.write(df.write_ndjson())
+        elif output_format == "parquet":
+            raise ValueError("Parquet output requires --output.")
+        else:
+            sys.stdout.write(df.write_csv(separator=separator))
+    elif output_format == "parquet":
+        lf.sink_parquet(args.output)
+    elif output_format == "ndjson":
+        lf.sink_ndjson(args.output)
+    else:
+        lf.sink_csv(args.output, separator=separator)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="countrycode",
+        description="Convert a column of country codes or names in a CSV, TSV, Parquet or NDJSON file.",
+    )
+    parser.add_argument("input", help="path to the input file")
+    parser.add_argument("-c", "--column", required=True, help="column to convert")
+    parser.add_argument(
+        "--origin", required=True, help="format of the input codes or names"
+    )
+    parser.add_argument(
+        "--destination", required=True, help="format of the output codes or names"
+    )
+    parser.add_argument(
+        "--into",
+        help="name of the output column; replaced if it exists, appended otherwise "
+        "(default: the destination)",
+    )
+    parser.add_argument(
+        "-o", "--output", help="path to the output file (default: standard output)"
+    )
+    parser.add_argument(
+        "--format", choices=sorted(set(FORMATS.values())), help="input file format"
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=sorted(set(FORMATS.values())),
+        help="output file format (default: inferred from --output, else the input format)",
+    )
+    parser.add_argument(
+        "--custom-dict", help="path to a custom dictionary (.pickle, .csv, .columns)"
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["auto", "polars", "python"],
+        default="auto",
+        help="polars lazy scans, or the standard library (default: polars if installed)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=10000,
+        help="rows converted at a time by the python engine (default: 10000)",
+    )
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.into is None:
+        args.into = args.destination
+
+    try:
+        input_format = _infer_format(args.input, args.format)
+        if args.output_format:
+            output_format = args.output_format
+        elif args.output in (None, "-"):
+            output_format = input_format
+        else:
+            output_format = _infer_format(args.output, None)
+
+        pl = None if args.engine == "python" else _import_polars()
+        if args.engine == "polars" and pl is None:
+            raise ImportError(
+                "The polars engine requires polars. Please install polars: pip install polars"
+            )
+
+        if pl is not None:
+            _run_polars(args, input_format, output_format, pl)
+        else:
+            _run_python(args, input_format, output_format)
+    except (ValueError, ImportError, NotImplementedError, OSError) as e:
+        print(f"countrycode: error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Columnar on-disk format for codelists.
+
+A `.columns` file stores each column of a codelist as an independent JSON
+array, so that a single column can be decoded without reading the others:
+
+    MAGIC | header length (8 bytes, little endian) | header (JSON) | columns
+
+The header records the number of rows and, for each column in order, the
+offset and length of its JSON array relative to the end of the header.
+"""
+
+import json
+import mmap
+import struct
+from collections.abc import Mapping
+
+MAGIC = b"CCCOLS1\n"
+
+
+def write_columnar(codelist, path):
+    """
+    Write a dict-of-lists codelist to `path` in the columnar format.
+
+    Parameters:
+    codelist (dict): Column names mapped to equal-length lists of values.
+    path (str or Path): Destination file, conventionally with a `.columns` suffix.
+    """
+    rows = {len(values) for values in codelist.values()}
+    if len(rows) > 1:
+        raise ValueError("All columns must have the same length.")
+
+    blobs = []
+    columns = {}
+    offset = 0
+    for name, values in codelist.items():
+        blob = json.dumps(list(values), ensure_ascii=False).encode("utf-8")
+        columns[name] = [offset, len(blob)]
+        blobs.append(blob)
+        offset += len(blob)
+
+    header = json.dumps({"rows": rows.pop() if rows else 0, "columns": columns})
+    header = header.encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+
+
+class ColumnarCodelist(Mapping):
+    """
+    Read-only codelist backed by a memory-mapped `.columns` file.
+
+    Only the header is read when the file is opened. Each column is decoded on
+    first access into a tuple and kept in memory afterwards, so memory use
+    grows with the columns actually used. Supports the read-only `dict`
+    interface, and can be shared between threads without locks.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        with open(self.path, "rb") as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._buffer[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"`{self.path}` is not a columnar codelist file.")
+        start = len(MAGIC) + 8
+        (header_length,) = struct.unpack("<Q", self._buffer[len(MAGIC) : start])
+        header = json.loads(self._buffer[start : start + header_length])
+        self._data_start = start + header_length
+        self.rows = header["rows"]
+        self._index = header["columns"]
+        self._columns = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._columns[key]
+        except KeyError:
+            pass
+        offset, length = self._index[key]
+        start = self._data_start + offset
+        column = tuple(json.loads(self._buffer[start : start + length]))
+        # Threads decoding the same column concurrently all get the first copy
+        return self._columns.setdefault(key, column)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def loaded_columns(self):
+        """
+        Names of the columns decoded so far.
+        """
+        return list(self._columns)
+
+    def __reduce__(self):
+        return (ColumnarCodelist, (self.path,))
+
+    def __repr__(self):
+        return f"ColumnarCodelist({self.path!r}, columns={len(self)}, rows={self.rows})"
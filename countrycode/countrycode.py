@@ -1,108 +1,244 @@
+import functools
+import hashlib
+import importlib.util
+import itertools
+import json
 import os
 import re
 import pickle
+import sys
+import threading
+from array import array
+from collections.abc import Mapping
 from pathlib import Path
 
-try:
-    import polars as pl
-except ImportError:
-    pl = None
-try:
-    import pandas as pd
+from .columnar import ColumnarCodelist
+
+try:  # Python >= 3.11
+    from re import _parser as sre_parse
 except ImportError:
-    pd = None
+    import sre_parse
+
+# Optional dataframe libraries, bound by `_detect_dataframe_libraries` once the
+# caller has imported them. Importing them here would make `import countrycode`
+# pay their import cost even when they are never used.
+pl = None
+pd = None
+np = None
 
 pkg_dir, pkg_filename = os.path.split(__file__)
 
-# Load the default codelist at module level for backwards compatibility
-codelist = None
 
+def _detect_dataframe_libraries():
+    """
+    Bind `pl`, `pd` and `np` to polars, pandas and NumPy if they have been
+    imported.
 
-def prepare_codelist(custom_dict=None, origin=None, destination=None):
+    Polars, pandas or NumPy objects can only exist once their library is
+    imported, so looking them up in `sys.modules` is enough to recognize such
+    inputs.
     """
-    Prepare and validate a codelist from various input types.
+    global pl, pd, np
+    if pl is None:
+        pl = sys.modules.get("polars")
+    if pd is None:
+        pd = sys.modules.get("pandas")
+    if np is None:
+        np = sys.modules.get("numpy")
 
-    Parameters:
-    custom_dict: Can be None, dict, polars.DataFrame, str (path), or Path
-    origin (str, optional): The origin column that must be present
-    destination (str, optional): The destination column that must be present
 
-    Returns:
-    dict: A validated codelist dictionary
+def _import_polars():
+    """
+    Import polars on demand, e.g. to read CSV files. Returns None if polars is
+    not installed.
+    """
+    global pl
+    if pl is None:
+        try:
+            import polars as pl
+        except ImportError:
+            return None
+    return pl
 
-    Raises:
-    ValueError: If validation fails
-    NotImplementedError: If the type is not supported
-    FileNotFoundError: If a file path doesn't exist
-    ImportError: If Polars is required but not installed
+
+def __getattr__(name):
+    # The default codelist is loaded on first access, for backwards compatibility
+    if name == "codelist":
+        return _public_codelist()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_codelist_dict = None
+
+
+def _public_codelist():
+    """
+    The default codelist as a plain dict of lists, as `countrycode.codelist`
+    has always been, e.g. to build a DataFrame. It is built on first access
+    and is a copy: conversions read the read-only columnar codelist.
     """
-    result_dict = None
-    source_description = None
+    global _codelist_dict
+    if _codelist_dict is None:
+        codelist = prepare_codelist(None)
+        _codelist_dict = {column: list(codelist[column]) for column in codelist}
+    return _codelist_dict
 
-    # Load/convert based on input type
-    if isinstance(custom_dict, (str, Path)):
-        # Load from file path
-        path = Path(custom_dict)
-        source_description = f"file '{path}'"
-        file_extension = path.suffix
 
-        if file_extension == ".pickle":
-            try:
-                with open(path, "rb") as f:
-                    result_dict = pickle.load(f)
-            except Exception:
-                raise FileNotFoundError(
-                    f"Could not find file at `{path}`. Please make sure the file exists at the provided path."
-                )
-            # If loaded data is a Polars DataFrame, convert to dict
-            if pl and isinstance(result_dict, pl.DataFrame):
-                result_dict = result_dict.to_dict(as_series=False)
-
-        elif file_extension == ".csv":
-            if not pl:
-                raise ImportError(
-                    "Polars is required to read CSV files. Please install polars: pip install polars"
-                )
-            try:
-                df = pl.read_csv(path)
-                result_dict = df.to_dict(as_series=False)
-            except Exception as e:
-                raise FileNotFoundError(
-                    f"Could not read CSV file at `{path}`. Error: {e}"
-                )
+# Process-wide registry of codelists read from disk, keyed by resolved path.
+# Each entry stores the file's modification time and size so that edits on disk
+# invalidate the cached copy on the next call.
+#
+# This cache and `_lookup_cache` are never modified in place: writers build a
+# new dict under `_cache_lock` and rebind the global, so readers in any thread
+# can look entries up without taking a lock.
+_codelist_cache = {}
+_cache_lock = threading.Lock()
 
-        else:
-            raise NotImplementedError(
-                f"Custom dicts with `{file_extension}` are not implemented yet. Please use a `.pickle` or `.csv` file."
+
+# The packaged default codelist, held directly once loaded so that calls using
+# it skip resolving and stat-ing its path. Files shipped with the package are
+# not edited while it runs, so only user-supplied paths are checked for changes.
+_default_codelist = None
+
+
+def _load_default_codelist():
+    global _default_codelist
+    codelist = _default_codelist
+    if codelist is None:
+        codelist = _default_codelist = _load_codelist_file(_default_codelist_path())
+    return codelist
+
+
+def _default_codelist_path():
+    # Prefer the columnar file, which decodes columns lazily on first access
+    path = os.path.join(pkg_dir, "data", "codelist.columns")
+    if os.path.exists(path):
+        return path
+    return os.path.join(pkg_dir, "data", "codelist.pickle")
+
+
+def _read_codelist_file(path):
+    """
+    Read a `.pickle`, `.csv` or `.columns` codelist from disk, without validation.
+    """
+    if path.suffix == ".columns":
+        try:
+            return ColumnarCodelist(path)
+        except OSError:
+            raise FileNotFoundError(
+                f"Could not find file at `{path}`. Please make sure the file exists at the provided path."
             )
 
-    elif isinstance(custom_dict, dict):
-        result_dict = custom_dict
-        source_description = "provided dict"
+    if path.suffix == ".pickle":
+        try:
+            with open(path, "rb") as f:
+                result_dict = pickle.load(f)
+        except Exception:
+            raise FileNotFoundError(
+                f"Could not find file at `{path}`. Please make sure the file exists at the provided path."
+            )
+        # If loaded data is a Polars DataFrame, convert to dict
+        _detect_dataframe_libraries()
+        if pl and isinstance(result_dict, pl.DataFrame):
+            result_dict = result_dict.to_dict(as_series=False)
+        return result_dict
 
-    elif pl and isinstance(custom_dict, pl.DataFrame):
-        result_dict = custom_dict.to_dict(as_series=False)
-        source_description = "provided Polars DataFrame"
+    if not _import_polars():
+        raise ImportError(
+            "Polars is required to read CSV files. Please install polars: pip install polars"
+        )
+    try:
+        df = pl.read_csv(path)
+    except Exception as e:
+        raise FileNotFoundError(f"Could not read CSV file at `{path}`. Error: {e}")
+    return df.to_dict(as_series=False)
 
-    elif custom_dict is None:
-        # Default data path is just data/codelist.pickle
-        default_path = os.path.join(pkg_dir, "data", "codelist.pickle")
-        return prepare_codelist(default_path, origin, destination)
 
-    else:
-        error_msg = (
-            "custom_dict must be one of: "
-            "None (use default), "
-            "dict, "
-            "str or Path (path to .pickle or .csv file)"
+def _load_codelist_file(path):
+    """
+    Return the validated codelist stored at `path`, reading it from disk only
+    if it is not cached yet or if the file changed since it was cached.
+    """
+    global _codelist_cache
+
+    path = Path(path)
+    if path.suffix not in (".pickle", ".csv", ".columns"):
+        raise NotImplementedError(
+            f"Custom dicts with `{path.suffix}` are not implemented yet. Please use a `.pickle`, `.csv` or `.columns` file."
         )
-        if pl:
-            error_msg += ", or polars.DataFrame"
-        error_msg += f". Got {type(custom_dict)}"
-        raise NotImplementedError(error_msg)
 
-    # Validate the structure
-    if not isinstance(result_dict, dict):
+    try:
+        key = str(path.resolve())
+        stat = os.stat(key)
+    except OSError:
+        if path.suffix != ".csv":
+            raise FileNotFoundError(
+                f"Could not find file at `{path}`. Please make sure the file exists at the provided path."
+            )
+        raise FileNotFoundError(
+            f"Could not read CSV file at `{path}`. Error: file does not exist"
+        )
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    entry = _codelist_cache.get(key)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+
+    result_dict = _read_codelist_file(path)
+    _validate_codelist(result_dict, f"file '{path}'")
+    if not isinstance(result_dict, ColumnarCodelist):
+        result_dict = FrozenCodelist(result_dict)
+
+    with _cache_lock:
+        cache = dict(_codelist_cache)
+        cache[key] = (signature, result_dict)
+        _codelist_cache = cache
+    return result_dict
+
+
+class FrozenCodelist(Mapping):
+    """
+    Read-only codelist whose columns are tuples.
+
+    Codelists read from `.pickle` or `.csv` files, and snapshots of custom
+    dicts, are stored in this form so that they can be shared between threads
+    without copies or locks. Supports the read-only `dict` interface.
+    """
+
+    __slots__ = ("_columns",)
+
+    def __init__(self, columns):
+        self._columns = {key: tuple(values) for key, values in columns.items()}
+
+    def __getitem__(self, key):
+        return self._columns[key]
+
+    def __contains__(self, key):
+        return key in self._columns
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+    def __reduce__(self):
+        return (FrozenCodelist, (self._columns,))
+
+    def __repr__(self):
+        rows = len(next(iter(self._columns.values()), ()))
+        return f"FrozenCodelist(columns={len(self)}, rows={rows})"
+
+
+def _validate_codelist(result_dict, source_description):
+    """
+    Check that a codelist is a non-empty dict of equal-length list-like columns.
+    """
+    if isinstance(result_dict, (ColumnarCodelist, FrozenCodelist)):
+        # Already validated when the file was read or the snapshot was taken
+        return
+
+    if not isinstance(result_dict, Mapping):
         raise ValueError(
             f"{source_description} must contain a dict-like structure, got {type(result_dict)}"
         )
@@ -126,6 +262,109 @@ def prepare_codelist(custom_dict=None, origin=None, destination=None):
             f"Found different lengths: {column_lengths}"
         )
 
+
+def clear_codelist_cache():
+    """
+    Drop every codelist cached by `prepare_codelist`.
+
+    The default codelist and any `.pickle` or `.csv` custom dicts will be read
+    from disk again on their next use.
+    """
+    global _codelist_cache, _default_codelist
+    with _cache_lock:
+        _codelist_cache = {}
+        _default_codelist = None
+
+
+def codelist_cache_info():
+    """
+    Describe the codelists currently held in the process-wide cache.
+
+    Returns:
+    dict: Maps each resolved file path to a dict with its `mtime_ns`, `size`
+    (in bytes), and the number of `columns` and `rows` of the cached codelist.
+    """
+    info = {}
+    for key, ((mtime_ns, size), result_dict) in _codelist_cache.items():
+        first_column = next(iter(result_dict.values()))
+        info[key] = {
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "columns": len(result_dict),
+            "rows": len(first_column),
+        }
+    return info
+
+
+def prepare_codelist(custom_dict=None, origin=None, destination=None):
+    """
+    Prepare and validate a codelist from various input types.
+
+    The default codelist and codelists read from `.pickle` or `.csv` files are
+    cached for the lifetime of the process and re-read only when the file
+    changes on disk. See `clear_codelist_cache` and `codelist_cache_info`.
+
+    Every codelist returned is read-only, so it can be shared between threads.
+    A dict or Polars DataFrame is copied into a `FrozenCodelist` snapshot on
+    first use, and the snapshot is reused while the dict is alive: changes made to the dict
+    afterwards take effect only after `clear_lookup_cache(custom_dict)`.
+
+    Parameters:
+    custom_dict: Can be None, dict, polars.DataFrame, str (path), or Path. Paths
+        may point to a `.pickle`, `.csv` or `.columns` file.
+    origin (str, optional): The origin column that must be present
+    destination (str or list, optional): The destination column(s) that must be present
+
+    Returns:
+    Mapping: A validated, read-only codelist with tuple columns. The default
+    codelist is a `ColumnarCodelist`, which decodes columns on first access;
+    other codelists are `FrozenCodelist` mappings.
+
+    Raises:
+    ValueError: If validation fails
+    NotImplementedError: If the type is not supported
+    FileNotFoundError: If a file path doesn't exist
+    ImportError: If Polars is required but not installed
+    """
+    _detect_dataframe_libraries()
+
+    # Load/convert based on input type
+    if custom_dict is None:
+        result_dict = _default_codelist
+        if result_dict is None:
+            result_dict = _load_default_codelist()
+        source_description = "default codelist"
+
+    elif isinstance(custom_dict, (str, Path)):
+        source_description = f"file '{Path(custom_dict)}'"
+        result_dict = _load_codelist_file(custom_dict)
+
+    elif isinstance(custom_dict, (ColumnarCodelist, FrozenCodelist)):
+        result_dict = custom_dict
+        source_description = "provided codelist"
+
+    elif isinstance(custom_dict, Mapping):
+        source_description = "provided dict"
+        result_dict = _cached_lookup("frozen", custom_dict, None, None, _freeze_dict)
+
+    elif pl and isinstance(custom_dict, pl.DataFrame):
+        source_description = "provided Polars DataFrame"
+        result_dict = _cached_lookup(
+            "frozen", custom_dict, None, None, _freeze_dataframe
+        )
+
+    else:
+        error_msg = (
+            "custom_dict must be one of: "
+            "None (use default), "
+            "dict, "
+            "str or Path (path to .pickle, .csv or .columns file)"
+        )
+        if importlib.util.find_spec("polars") is not None:
+            error_msg += ", or polars.DataFrame"
+        error_msg += f". Got {type(custom_dict)}"
+        raise NotImplementedError(error_msg)
+
     # Validate required columns if specified
     if origin is not None and origin not in result_dict:
         raise ValueError(
@@ -133,20 +372,97 @@ def prepare_codelist(custom_dict=None, origin=None, destination=None):
             f"Available columns: {', '.join(result_dict.keys())}"
         )
 
-    if destination is not None and destination not in result_dict:
-        raise ValueError(
-            f"{source_description} must contain the destination column '{destination}'. "
-            f"Available columns: {', '.join(result_dict.keys())}"
-        )
+    destinations = (
+        destination if isinstance(destination, (list, tuple)) else [destination]
+    )
+    for destination in destinations:
+        if destination is not None and destination not in result_dict:
+            raise ValueError(
+                f"{source_description} must contain the destination column '{destination}'. "
+                f"Available columns: {', '.join(result_dict.keys())}"
+            )
 
     return result_dict
 
 
+def _freeze_dict(origin, destination, custom_dict):
+    """
+    Validate a custom dict and take a read-only snapshot of it.
+    """
+    _validate_codelist(custom_dict, "provided dict")
+    return FrozenCodelist(custom_dict)
+
+
+def _freeze_dataframe(origin, destination, custom_dict):
+    """
+    Validate a Polars DataFrame and take a read-only snapshot of it.
+    """
+    result_dict = custom_dict.to_dict(as_series=False)
+    _validate_codelist(result_dict, "provided Polars DataFrame")
+    return FrozenCodelist(result_dict)
+
+
+# Origins accepted when using the default codelist
+_VALID_ORIGINS = [
+    "cctld",
+    "country.name",
+    "country.name.de",
+    "country.name.fr",
+    "country.name.it",
+    "cowc",
+    "cown",
+    "dhs",
+    "ecb",
+    "eurostat",
+    "fao",
+    "fips",
+    "gaul",
+    "genc2c",
+    "genc3c",
+    "genc3n",
+    "gwc",
+    "gwn",
+    "imf",
+    "ioc",
+    "iso2c",
+    "iso3c",
+    "iso3n",
+    "p5c",
+    "p5n",
+    "p4c",
+    "p4n",
+    "un",
+    "un_m49",
+    "unicode.symbol",
+    "unhcr",
+    "unpd",
+    "vdem",
+    "wb",
+    "wb_api2c",
+    "wb_api3c",
+    "wvs",
+    "country.name.en.regex",
+    "country.name.de.regex",
+    "country.name.fr.regex",
+    "country.name.it.regex",
+]
+
+# Origins converted with regular expressions rather than exact matching
+_REGEX_ORIGINS = [
+    "country.name.en.regex",
+    "country.name.fr.regex",
+    "country.name.de.regex",
+    "country.name.it.regex",
+]
+
+
 def countrycode(
     sourcevar=["DZA", "CAN"],
     origin="iso3c",
     destination="country.name.en",
     custom_dict=None,
+    n_jobs=None,
+    executor=None,
 ):
     """
     Convert country codes or names from one format to another.
@@ -155,25 +471,41 @@ def countrycode(
     format, such as ISO 3-letter codes, country names in different languages, etc.
 
     Parameters:
-    sourcevar (list, str, int, or polars.series.series.Series, optional):
-        A list, string, integer, or Polars Series of country codes or names to be converted. Default is ['DZA', 'CAN'].
+    sourcevar (list, str, int, polars.series.series.Series, polars.Expr, pandas.Series, or numpy.ndarray, optional):
+        A list, string, integer, Series, Polars expression, or NumPy array of country codes or names to be converted. Default is ['DZA', 'CAN'].
     origin (str, optional):
         The format of the input country codes or names. Default is 'iso3c'.
-    destination (str, optional):
+    destination (str or list, optional):
         The desired format of the output country codes or names. Default is 'country.name.en'.
+        If a list, the input is matched once and converted to every destination in the list.
     custom_dict (str, Path, dict, polars.DataFrame, optional):
         A custom dictionary to be used for country code translations. Can be:
         - None: Use the default built-in dictionary (default)
         - dict: A raw dictionary with column names as keys and lists as values
         - polars.DataFrame: A Polars DataFrame (will be converted to dict internally)
-        - str or Path: Path to a `.pickle` file (containing dict or DataFrame) or `.csv` file
+        - str or Path: Path to a `.pickle` file (containing dict or DataFrame), `.csv` file, or `.columns` file (see `countrycode.columnar`)
+    n_jobs (int, optional):
+        Number of worker processes used to match distinct strings against the regexes of `country.name` origins.
+        None or 1 (default) matches in the current process, -1 uses all CPUs. Exact origins ignore this argument.
+        Inputs with fewer than 1000 distinct strings are always matched in the current process.
+    executor (concurrent.futures.Executor, optional):
+        An existing executor, e.g. a `ProcessPoolExecutor` reused across calls, used instead of `n_jobs` to
+        match distinct strings against the regexes of `country.name` origins.
 
     Returns:
     list, str, or polars.series.series.Series:
         The converted country codes or names in the desired format. The output type depends on the input type:
         - If `sourcevar` is a string or int, returns a string.
         - If `sourcevar` is a list, returns a list.
-        - If `sourcevar` is a Polars Series, returns a Polars Series.
+        - If `sourcevar` is a Polars Series, returns a Polars Series with the same name and null mask.
+        - If `sourcevar` is a pandas Series, returns a pandas Series with the same index and name, and a nullable `Int64` or `string` dtype when possible.
+        - If `sourcevar` is a Polars expression, returns a Polars expression, e.g. for use in `pl.LazyFrame.with_columns`.
+        - If `sourcevar` is a NumPy array, returns a NumPy array of the same shape, with an `int64` or unicode dtype
+          when every value converts to an integer or a string, and an object dtype with `None` for missing values otherwise.
+        - If `destination` is a list, returns a dict mapping each destination to its output as above, except that
+          Series inputs return a DataFrame with one column per destination, and Polars expressions return an
+          expression which expands to one column per destination. As Polars structs cannot hold Object columns,
+          a list of expressions, one per destination, is returned instead if a destination has mixed types.
 
     Raises:
     ValueError:
@@ -198,6 +530,32 @@ def countrycode(
     This function uses two helper functions (`replace_regex` and `replace_exact`) to perform the actual conversion.
     """
 
+    _check_n_jobs(n_jobs)
+    origin, destination, codelist_data, regex = _resolve_arguments(
+        origin, destination, custom_dict
+    )
+    return _convert(
+        sourcevar,
+        origin,
+        destination,
+        codelist_data,
+        regex,
+        n_jobs=n_jobs,
+        executor=executor,
+    )
+
+
+def _resolve_arguments(origin, destination, custom_dict):
+    """
+    Expand the `origin` and `destination` shortcuts, load and validate the
+    codelist, and check `origin` against the supported codes when using the
+    default codelist.
+
+    Returns:
+    tuple: (origin, destination, codelist, regex), where `regex` is True if
+    `origin` is converted with regular expressions. `destination` is a list
+    if several destinations were requested.
+    """
     # user convenience shortcuts only for default dict
     if origin == "country.name":
         origin = "country.name.en.regex"
@@ -210,7 +568,18 @@ def countrycode(
     ]:
         origin = origin + ".regex"
 
-    if destination == "country.name":
+    if isinstance(destination, (list, tuple)):
+        # Repeated destinations, e.g. 'country.name' and 'country.name.en',
+        # are converted once
+        destination = list(
+            dict.fromkeys(
+                "country.name.en" if name == "country.name" else name
+                for name in destination
+            )
+        )
+        if not destination:
+            raise ValueError("destination must contain at least one column name")
+    elif destination == "country.name":
         destination = "country.name.en"
 
     # Load and validate the codelist dict with required columns
@@ -219,52 +588,49 @@ def countrycode(
     )
 
     # Only validate origin against the predefined list if using the default dictionary
-    if custom_dict is None:
-        valid = [
-            "cctld",
-            "country.name",
-            "country.name.de",
-            "country.name.fr",
-            "country.name.it",
-            "cowc",
-            "cown",
-            "dhs",
-            "ecb",
-            "eurostat",
-            "fao",
-            "fips",
-            "gaul",
-            "genc2c",
-            "genc3c",
-            "genc3n",
-            "gwc",
-            "gwn",
-            "imf",
-            "ioc",
-            "iso2c",
-            "iso3c",
-            "iso3n",
-            "p5c",
-            "p5n",
-            "p4c",
-            "p4n",
-            "un",
-            "un_m49",
-            "unicode.symbol",
-            "unhcr",
-            "unpd",
-            "vdem",
-            "wb",
-            "wb_api2c",
-            "wb_api3c",
-            "wvs",
-            "country.name.en.regex",
-            "country.name.de.regex",
-            "country.name.fr.regex",
-            "country.name.it.regex",
-        ]
-        if origin not in valid:
-            raise ValueError("origin must be one of: " + ", ".join(valid))
+    if custom_dict is None and origin not in _VALID_ORIGINS:
+        raise ValueError("origin must be one of: " + ", ".join(_VALID_ORIGINS))
+
+    return origin, destination, codelist_data, origin in _REGEX_ORIGINS
+
+
+def _convert(
+    sourcevar, origin, destination, codelist_data, regex, n_jobs=None, executor=None
+):
+    """
+    Dispatch `sourcevar` to the conversion engine suited to its type, and
+    return the result in the same container type.
+    """
+    _detect_dataframe_libraries()
+
+    if isinstance(destination, list):
+        return _convert_many(
+            sourcevar, origin, destination, codelist_data, regex, n_jobs, executor
+        )
+
+    # Polars inputs are converted natively when their dtype allows it
+    if pl and isinstance(sourcevar, pl.Expr):
+        return replace_polars_expr(
+            sourcevar, origin, destination, codelist_data, regex, n_jobs, executor
+        )
+    if pl and isinstance(sourcevar, pl.series.series.Series):
+        out = replace_polars(
+            sourcevar, origin, destination, codelist_data, regex, n_jobs, executor
+        )
+        if out is not None:
+            return out
+
+    if pd and isinstance(sourcevar, pd.Series):
+        out = replace_pandas(
+            sourcevar, origin, destination, codelist_data, regex, n_jobs, executor
+        )
+        if out is not None:
+            return out
+
+    if np and isinstance(sourcevar, np.ndarray):
+        return replace_numpy(
+            sourcevar, origin, destination, codelist_data, regex, n_jobs, executor
+        )
 
     sourcevar_series = sourcevar
     if pl:
@@ -277,13 +643,10 @@ def countrycode(
         sourcevar_series = [sourcevar]
 
     # conversion
-    if origin in [
-        "country.name.en.regex",
-        "country.name.fr.regex",
-        "country.name.de.regex",
-        "country.name.it.regex",
-    ]:
-        out = replace_regex(sourcevar_series, origin, destination, codelist_data)
+    if regex:
+        out = replace_regex(
+            sourcevar_series, origin, destination, codelist_data, n_jobs, executor
+        )
     else:
         out = replace_exact(sourcevar_series, origin, destination, codelist_data)
 
@@ -291,77 +654,1716 @@ def countrycode(
     if isinstance(sourcevar, (str, int)):
         return out[0]
     elif pl and isinstance(sourcevar, pl.series.series.Series):
-        return pl.Series(out)
+        return pl.Series(sourcevar.name, out)
     elif pd and isinstance(sourcevar, pd.Series):
-        return pd.Series(out)
+        return pd.Series(out, index=sourcevar.index, name=sourcevar.name)
     else:
         return out
 
 
-def get_first_match(pattern, string_list):
-    for string in string_list:
-        match = pattern.search(string)
-        if match:
-            return match.group()
-    return None
+def _build_exact_rows(origin, destination, codelist):
+    """
+    Map each origin value to the first row where it appears.
+    """
+    rows = _matrix_rows(origin, codelist)
+    if rows is not None:
+        return rows
+    rows = {}
+    for position, value in enumerate(codelist[origin]):
+        if value is not None and value not in rows:
+            rows[value] = position
+    return rows
 
 
-def replace_exact(sourcevar, origin, destination, codelist):
-    out = []
-    for string in sourcevar:
-        match_found = False
-        for position, origin_i in enumerate(codelist[origin]):
-            if origin_i is None or codelist[destination][position] is None:
+def _compile_rows(origin, codelist):
+    """
+    Compile the origin patterns, in codelist order, paired with their row.
+    """
+    return tuple(
+        (re.compile(pattern, flags=re.IGNORECASE), position)
+        for position, pattern in enumerate(codelist[origin])
+        if pattern is not None
+    )
+
+
+def _build_regex_rows(origin, destination, codelist):
+    """
+    Regex matcher which resolves a string to the first row whose origin
+    pattern matches, regardless of the destination.
+
+    Its shortcut is the precomputed alias table when one was built from the
+    same origin column, in which case no regex is compiled until a string
+    misses it. Otherwise, it is computed from the origin's name columns.
+    """
+    shortcut = _precomputed_aliases(origin, codelist)
+    if shortcut is None and _alias_columns(origin, codelist):
+        matcher = _RegexMatcher(_compile_rows(origin, codelist))
+        # Set before the matcher is cached and shared
+        matcher.shortcut = _name_shortcut(matcher, origin, codelist)
+        return matcher
+    return _RegexMatcher(functools.partial(_compile_rows, origin, codelist), shortcut)
+
+
+def _row_resolver(origin, codelist, regex):
+    """
+    Function mapping an origin value to its first matching row, or None.
+    """
+    if regex:
+        return _cached_lookup(
+            "regex_rows", codelist, origin, None, _build_regex_rows
+        ).match
+    return _cached_lookup("exact_rows", codelist, origin, None, _build_exact_rows).get
+
+
+def _locate_unique(uniques, origin, codelist, regex, n_jobs=None, executor=None):
+    """
+    First matching row of each of the distinct, hashable, non-None `uniques`,
+    or None.
+    """
+    if regex and ((n_jobs is not None and n_jobs != 1) or executor is not None):
+        matcher = _cached_lookup(
+            "regex_rows", codelist, origin, None, _build_regex_rows
+        )
+        return _parallel_match(uniques, matcher, n_jobs, executor)
+    resolve = _row_resolver(origin, codelist, regex)
+    return [resolve(value) for value in uniques]
+
+
+def _replace_many_unique(
+    uniques, origin, destinations, codelist, regex, n_jobs=None, executor=None
+):
+    """
+    Convert distinct, hashable, non-None values to several destinations.
+
+    Each value is resolved to a codelist row once, and every destination is
+    read from that row. When the first matching row has no value for a
+    destination, the value is resolved again with that destination's engine,
+    which skips such rows, so results are identical to separate conversions.
+
+    Returns:
+    dict: Maps each destination to a list of outputs aligned with `uniques`.
+    """
+    rows = _locate_unique(uniques, origin, codelist, regex, n_jobs, executor)
+
+    out = {}
+    for destination in destinations:
+        column = codelist[destination]
+        fallback = None
+        values = []
+        for value, row in zip(uniques, rows):
+            if row is None:
+                values.append(None)
                 continue
-            if string == origin_i:
-                if (
-                    isinstance(codelist[destination][position], str)
-                    and codelist[destination][position].isdigit()
-                ):
-                    out.append(int(codelist[destination][position]))
-                else:
-                    out.append(codelist[destination][position])
-                match_found = True
-                break
-        if not match_found:
-            out.append(None)
+            converted = column[row]
+            if converted is None:
+                if fallback is None:
+                    if regex:
+                        fallback = _regex_matcher(origin, destination, codelist).match
+                    else:
+                        fallback = _exact_table(origin, destination, codelist).get
+                values.append(fallback(value))
+            else:
+                values.append(_as_output(converted))
+        out[destination] = values
     return out
 
 
-def replace_regex(sourcevar, origin, destination, codelist):
-    sourcevar_unique = list(set(sourcevar))
-    o = []
-    d = []
-    for i, (val_origin, val_destination) in enumerate(
-        zip(codelist[origin], codelist[destination])
-    ):
-        if val_origin is not None and val_destination is not None:
-            o.append(re.compile(val_origin, flags=re.IGNORECASE))
-            d.append(val_destination)
-
-    result = []
-    for string in sourcevar_unique:
-        match_found = False
-        for position, regex in enumerate(o):
-            if re.search(regex, string):
-                result.append(d[position])
-                match_found = True
-                break
-        if not match_found:
-            result.append(None)
-    mapping = dict(zip(sourcevar_unique, result))
-    out = [
-        int(mapping[i])
-        if mapping[i] and isinstance(mapping[i], str) and mapping[i].isdigit()
-        else mapping[i]
-        for i in sourcevar
-    ]
-    return out
+def _destination_values(origin, destination, codelist, regex):
+    """
+    All the values a conversion to `destination` can return, to pick a dtype.
+    """
+    if regex:
+        return _regex_values(origin, destination, codelist)
+    return _exact_table(origin, destination, codelist).values()
+
+
+def _convert_many(
+    sourcevar, origin, destinations, codelist, regex, n_jobs=None, executor=None
+):
+    """
+    Convert `sourcevar` to several destinations, matching each distinct value
+    once. See `_replace_many_unique`.
+    """
+    # Polars expressions expand to one column per destination
+    if pl and isinstance(sourcevar, pl.Expr):
+        dtypes = {}
+        for destination in destinations:
+            dtype = _polars_dtype(
+                _destination_values(origin, destination, codelist, regex)
+            )
+            dtypes[destination] = pl.Object if dtype is None else dtype
+
+        if pl.Object in dtypes.values():
+            # Structs cannot hold Object columns, so mixed-type destinations
+            # need one expression per destination
+            return [
+                replace_polars_expr(
+                    sourcevar, origin, destination, codelist, regex, n_jobs, executor
+                ).alias(destination)
+                for destination in destinations
+            ]
+
+        def convert(series):
+            frame = _convert_many(
+                series, origin, destinations, codelist, regex, n_jobs, executor
+            )
+            return frame.to_struct(series.name)
+
+        return sourcevar.map_batches(
+            convert, return_dtype=pl.Struct(dtypes), is_elementwise=True
+        ).struct.unnest()
+
+    if pl and isinstance(sourcevar, pl.series.series.Series):
+        series = sourcevar
+        if series.dtype == pl.Categorical:
+            series = series.cast(pl.String)
+        if series.dtype == pl.String or series.dtype.is_integer():
+            uniques = series.drop_nulls().unique().to_list()
+            converted = _replace_many_unique(
+                uniques, origin, destinations, codelist, regex, n_jobs, executor
+            )
+            columns = {}
+            for destination, values in converted.items():
+                dtype = _polars_dtype(
+                    _destination_values(origin, destination, codelist, regex)
+                )
+                if dtype is None:
+                    # replace_strict cannot build Object columns
+                    mapping = dict(zip(uniques, values))
+                    columns[destination] = pl.Series(
+                        destination,
+                        [mapping.get(value) for value in series.to_list()],
+                        dtype=pl.Object,
+                    )
+                else:
+                    columns[destination] = series.replace_strict(
+                        uniques, values, default=None, return_dtype=dtype
+                    )
+            return pl.DataFrame(columns)
+        out = _convert_many(series.to_list(), origin, destinations, codelist, regex)
+        columns = {}
+        for destination, values in out.items():
+            dtype = _polars_dtype(
+                _destination_values(origin, destination, codelist, regex)
+            )
+            columns[destination] = pl.Series(
+                destination, values, dtype=pl.Object if dtype is None else dtype
+            )
+        return pl.DataFrame(columns)
+
+    if pd and isinstance(sourcevar, pd.Series):
+        if isinstance(sourcevar.dtype, pd.CategoricalDtype):
+            codes = sourcevar.cat.codes.to_numpy()
+            uniques = sourcevar.cat.categories.tolist()
+        else:
+            try:
+                codes, uniques = pd.factorize(sourcevar)
+            except TypeError:
+                out = _convert_many(
+                    sourcevar.to_list(), origin, destinations, codelist, regex
+                )
+                return pd.DataFrame(out, index=sourcevar.index)
+            uniques = uniques.tolist()
+        converted = _replace_many_unique(
+            uniques, origin, destinations, codelist, regex, n_jobs, executor
+        )
+        columns = {}
+        for destination, values in converted.items():
+            dtype = _pandas_dtype(
+                _destination_values(origin, destination, codelist, regex)
+            )
+            columns[destination] = pd.array(values + [None], dtype=dtype).take(codes)
+        return pd.DataFrame(columns, index=sourcevar.index)
+
+    if np and isinstance(sourcevar, np.ndarray):
+        factorized = _numpy_unique(sourcevar)
+        if factorized is None:
+            out = _convert_many(
+                sourcevar.ravel().tolist(), origin, destinations, codelist, regex
+            )
+            return {
+                key: _numpy_take(value, np.arange(len(value))).reshape(sourcevar.shape)
+                for key, value in out.items()
+            }
+        uniques, inverse = factorized
+        converted = _replace_many_unique(
+            uniques, origin, destinations, codelist, regex, n_jobs, executor
+        )
+        return {
+            destination: _numpy_take(values, inverse).reshape(sourcevar.shape)
+            for destination, values in converted.items()
+        }
+
+    if isinstance(sourcevar, (str, int)):
+        converted = _convert_many(
+            [sourcevar], origin, destinations, codelist, regex, n_jobs, executor
+        )
+        return {key: value[0] for key, value in converted.items()}
+
+    def convert(keys):
+        converted = _replace_many_unique(
+            keys, origin, destinations, codelist, regex, n_jobs, executor
+        )
+        return list(zip(*converted.values()))
+
+    out = _unique_then_broadcast(sourcevar, convert)
+    missing = (None,) * len(destinations)
+    return {
+        destination: [(row or missing)[position] for row in out]
+        for position, destination in enumerate(destinations)
+    }
 
 
-# Initialize module-level codelist for backwards compatibility
-try:
-    codelist = prepare_codelist(None)
-except Exception:
-    # If loading fails, keep it as None
-    pass
+# Maximum number of regex resolutions remembered by a `Converter` or a stream
+# from `iter_convert`, beyond which the memo is reset to bound memory use.
+_MEMO_SIZE = 65536
+
+
+class Converter:
+    """
+    Reusable conversion from one code or name format to another.
+
+    All the setup done by `countrycode` on each call (argument validation,
+    loading the codelist, building the lookup table or compiling the regexes)
+    is done once, when the converter is created. Calling the converter is
+    then cheap enough for per-row use in `map` or `apply`. Converters can be
+    pickled, e.g. to send them to worker processes.
+
+    Parameters:
+    origin (str):
+        The format of the input country codes or names. Same values as in `countrycode`.
+    destination (str):
+        The desired format of the output country codes or names.
+    custom_dict (str, Path, dict, polars.DataFrame, optional):
+        A custom dictionary to be used for country code translations. See `countrycode`.
+
+    Example:
+    >>> to_iso3c = Converter("country.name", "iso3c")
+    >>> to_iso3c("alGeria")
+    'DZA'
+    >>> to_iso3c(["Canada", "Algeria"])
+    ['CAN', 'DZA']
+    """
+
+    def __init__(self, origin, destination, custom_dict=None):
+        self.origin, self.destination, self.codelist, self.regex = _resolve_arguments(
+            origin, destination, custom_dict
+        )
+        if isinstance(self.destination, list):
+            raise ValueError("Converter requires a single destination column")
+        self.custom_dict = custom_dict
+        if self.regex:
+            self._matcher = _regex_matcher(self.origin, self.destination, self.codelist)
+            self._memo = {}
+        else:
+            self._table = _exact_table(self.origin, self.destination, self.codelist)
+
+    def __call__(self, sourcevar):
+        """
+        Convert `sourcevar`, with the same input and output types as `countrycode`.
+        """
+        if isinstance(sourcevar, (str, int)):
+            if not self.regex:
+                return self._table.get(sourcevar)
+            try:
+                return self._memo[sourcevar]
+            except KeyError:
+                pass
+            out = self._matcher.match(sourcevar)
+            if len(self._memo) >= _MEMO_SIZE:
+                self._memo.clear()
+            self._memo[sourcevar] = out
+            return out
+        return _convert(
+            sourcevar, self.origin, self.destination, self.codelist, self.regex
+        )
+
+    def as_dict(self):
+        """
+        Export the resolved mapping as a plain dict.
+
+        For exact origins, maps each origin value of the codelist to its
+        destination value. For regex origins, maps each origin pattern to its
+        destination value, in the order in which patterns are tried.
+        """
+        if self.regex:
+            return {regex.pattern: value for regex, value in self._matcher.table}
+        return dict(self._table)
+
+    def __reduce__(self):
+        custom_dict = self.custom_dict
+        if custom_dict is not None and not isinstance(custom_dict, (str, Path)):
+            custom_dict = self.codelist
+        return (Converter, (self.origin, self.destination, custom_dict))
+
+    def __repr__(self):
+        return f"Converter(origin={self.origin!r}, destination={self.destination!r})"
+
+
+def iter_convert(
+    iterable,
+    origin="iso3c",
+    destination="country.name.en",
+    custom_dict=None,
+    chunk_size=10000,
+):
+    """
+    Lazily convert a stream of country codes or names.
+
+    `iterable` is consumed in chunks of `chunk_size` values, which are
+    converted with the same engines as `countrycode`, so memory use does not
+    grow with the length of the stream. Regex resolutions are remembered for
+    the whole stream, so each distinct spelling is matched only once.
+
+    Parameters:
+    iterable (iterable):
+        Any iterable of country codes or names, e.g. a file or a generator.
+    origin (str, optional):
+        The format of the input country codes or names. Default is 'iso3c'.
+    destination (str, optional):
+        The desired format of the output country codes or names. Default is 'country.name.en'.
+    custom_dict (str, Path, dict, polars.DataFrame, optional):
+        A custom dictionary to be used for country code translations. See `countrycode`.
+    chunk_size (int, optional):
+        Number of values read from `iterable` and converted at a time. Default is 10000.
+
+    Returns:
+    generator: The converted values, in the order of `iterable`.
+
+    Raises:
+    ValueError:
+        If `chunk_size` is not a positive integer, and as in `countrycode`.
+
+    Example:
+    >>> list(iter_convert(iter(["DZA", "CAN"]), "iso3c", "iso2c"))
+    ['DZ', 'CA']
+    """
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+
+    # Validate arguments and build the lookup table before the first value is requested
+    origin, destination, codelist_data, regex = _resolve_arguments(
+        origin, destination, custom_dict
+    )
+    if isinstance(destination, list):
+        raise ValueError("iter_convert requires a single destination column")
+    if regex:
+        match = _regex_matcher(origin, destination, codelist_data).match
+    else:
+        match = _exact_table(origin, destination, codelist_data).get
+
+    return _iter_convert(iter(iterable), match, chunk_size)
+
+
+def _iter_convert(iterator, match, chunk_size):
+    memo = {}
+
+    def convert(keys):
+        out = []
+        for key in keys:
+            try:
+                out.append(memo[key])
+            except KeyError:
+                out.append(memo.setdefault(key, match(key)))
+        return out
+
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        if len(memo) >= _MEMO_SIZE:
+            memo.clear()
+        yield from _unique_then_broadcast(chunk, convert)
+
+
+def locate(sourcevar, origin="iso3c", custom_dict=None, n_jobs=None, executor=None):
+    """
+    Resolve country codes or names to their row in the codelist.
+
+    Each distinct value is matched once, with the same engines as
+    `countrycode`, against the cached row index of `origin`. The rows can then
+    be read in any number of destinations with `take`, without matching the
+    input again.
+
+    Parameters:
+    sourcevar (list, str, int, polars.Series, pandas.Series, or numpy.ndarray):
+        Country codes or names to resolve.
+    origin (str, optional):
+        The format of the input country codes or names. Same values as in `countrycode`. Default is 'iso3c'.
+    custom_dict (str, Path, dict, polars.DataFrame, optional):
+        A custom dictionary to be used for country code translations. See `countrycode`.
+    n_jobs (int, optional), executor (concurrent.futures.Executor, optional):
+        Match strings in worker processes for regex origins. See `countrycode`.
+
+    Returns:
+    The index of the first codelist row matching each value, or -1 if none
+    does, in the same container type as `sourcevar`: an int for a scalar, a
+    list, an `Int64` Polars Series, an `int64` pandas Series, or an `intp`
+    NumPy array.
+
+    Example:
+    >>> rows = locate(['Canada', 'alGeria', 'Atlantis'], 'country.name')
+    >>> rows
+    [42, 2, -1]
+    >>> take(rows, 'iso3c')
+    ['CAN', 'DZA', None]
+    """
+    _check_n_jobs(n_jobs)
+    origin, _, codelist_data, regex = _resolve_arguments(origin, None, custom_dict)
+    _detect_dataframe_libraries()
+
+    if isinstance(sourcevar, (str, int)):
+        return _locate_list([sourcevar], origin, codelist_data, regex)[0]
+
+    if np and isinstance(sourcevar, np.ndarray):
+        if not regex and sourcevar.dtype.kind in "iu":
+            # With the origin as destination, the dense table holds first rows
+            table = _dense_table(origin, origin, codelist_data)
+            if table is not None:
+                return _dense_rows(table[0], sourcevar.ravel()).reshape(sourcevar.shape)
+        factorized = _numpy_unique(sourcevar)
+        if factorized is None:
+            rows = _locate_list(
+                sourcevar.ravel().tolist(),
+                origin,
+                codelist_data,
+                regex,
+                n_jobs,
+                executor,
+            )
+            return np.array(rows, dtype=np.intp).reshape(sourcevar.shape)
+        uniques, inverse = factorized
+        rows = _locate_list(uniques, origin, codelist_data, regex, n_jobs, executor)
+        return np.array(rows, dtype=np.intp)[inverse].reshape(sourcevar.shape)
+
+    if pl and isinstance(sourcevar, pl.series.series.Series):
+        series = sourcevar
+        if series.dtype == pl.Categorical:
+            series = series.cast(pl.String)
+        if series.dtype == pl.String or series.dtype.is_integer():
+            # Resolve the uniques once and broadcast their rows natively
+            uniques = series.drop_nulls().unique().to_list()
+            rows = _locate_list(uniques, origin, codelist_data, regex, n_jobs, executor)
+            return series.replace_strict(
+                uniques, rows, default=-1, return_dtype=pl.Int64
+            ).fill_null(-1)
+        rows = _locate_list(
+            sourcevar.to_list(), origin, codelist_data, regex, n_jobs, executor
+        )
+        return pl.Series(sourcevar.name, rows, dtype=pl.Int64)
+
+    if pd and isinstance(sourcevar, pd.Series):
+        if isinstance(sourcevar.dtype, pd.CategoricalDtype):
+            codes = sourcevar.cat.codes.to_numpy()
+            uniques = sourcevar.cat.categories.tolist()
+        else:
+            try:
+                codes, uniques = pd.factorize(sourcevar)
+            except TypeError:
+                codes = None
+            else:
+                uniques = uniques.tolist()
+        if codes is None:
+            rows = _locate_list(
+                sourcevar.to_list(), origin, codelist_data, regex, n_jobs, executor
+            )
+        else:
+            rows = _locate_list(uniques, origin, codelist_data, regex, n_jobs, executor)
+            # Missing values have code -1, which takes the trailing -1
+            rows = pd.array(rows + [-1], dtype="int64").take(codes)
+        return pd.Series(
+            rows, index=sourcevar.index, name=sourcevar.name, dtype="int64"
+        )
+
+    return _locate_list(sourcevar, origin, codelist_data, regex, n_jobs, executor)
+
+
+def _locate_list(sourcevar, origin, codelist, regex, n_jobs=None, executor=None):
+    def convert(keys):
+        if regex:
+            # Only strings can match a pattern
+            keys = [key if isinstance(key, str) else None for key in keys]
+            strings = [key for key in keys if key is not None]
+            found = dict(
+                zip(
+                    strings,
+                    _locate_unique(strings, origin, codelist, regex, n_jobs, executor),
+                )
+            )
+            return [found.get(key) for key in keys]
+        return _locate_unique(keys, origin, codelist, regex)
+
+    rows = _unique_then_broadcast(sourcevar, convert)
+    return [-1 if row is None else row for row in rows]
+
+
+def take(rows, destination="country.name.en", custom_dict=None):
+    """
+    Read the `destination` values of codelist rows found by `locate`.
+
+    Parameters:
+    rows (list, int, polars.Series, pandas.Series, or numpy.ndarray):
+        Codelist row indices, where -1 stands for no match.
+    destination (str or list, optional):
+        The desired format of the output country codes or names. Default is 'country.name.en'.
+        If a list, a dict mapping each destination to its output is returned.
+    custom_dict (str, Path, dict, polars.DataFrame, optional):
+        The custom dictionary that `rows` were located in, if any. See `countrycode`.
+
+    Returns:
+    The destination value of each row, or None for -1 and for rows that have
+    no value, in the same container type as `rows`. Outputs have the same
+    types and dtypes as those of `countrycode`.
+
+    Note:
+    A value is read from the first row matching it. When that row has no
+    destination value, `countrycode` would look for a later matching row
+    that has one, so the two can differ.
+    """
+    if isinstance(destination, (list, tuple)):
+        return {
+            "country.name.en" if name == "country.name" else name: take(
+                rows, name, custom_dict
+            )
+            for name in destination
+        }
+    if destination == "country.name":
+        destination = "country.name.en"
+    codelist_data = prepare_codelist(custom_dict, destination=destination)
+    _detect_dataframe_libraries()
+
+    values = [_as_output(value) for value in codelist_data[destination]]
+    present = [value for value in values if value is not None]
+
+    if isinstance(rows, int) or (np and isinstance(rows, np.integer)):
+        return None if rows < 0 else values[rows]
+    if np and isinstance(rows, np.ndarray):
+        return _numpy_take(values, rows)
+    if pl and isinstance(rows, pl.series.series.Series):
+        # Shift rows by one so that -1 takes the leading None
+        dtype = _polars_dtype(present)
+        column = pl.Series(rows.name, [None] + values, dtype=dtype or pl.Object)
+        return column.gather(rows + 1)
+    if pd and isinstance(rows, pd.Series):
+        column = pd.array(values + [None], dtype=_pandas_dtype(present))
+        return pd.Series(column.take(rows.to_numpy()), index=rows.index, name=rows.name)
+    return [None if row < 0 else values[row] for row in rows]
+
+
+# Inputs shorter than this are converted inline by `acountrycode`, and longer
+# ones are sent to the executor in chunks of `_ASYNC_CHUNK_SIZE` values.
+_ASYNC_INLINE_SIZE = 1000
+_ASYNC_CHUNK_SIZE = 10000
+
+
+async def acountrycode(
+    sourcevar=["DZA", "CAN"],
+    origin="iso3c",
+    destination="country.name.en",
+    custom_dict=None,
+    n_jobs=None,
+    executor=None,
+):
+    """
+    Convert country codes or names without blocking the event loop.
+
+    Takes the same arguments and returns the same results as `countrycode`.
+    Scalars, Polars expressions and inputs of fewer than 1000 values are
+    converted inline. Larger lists are converted in chunks of 10000 values in
+    `executor`, or in the event loop's default executor if None, and the loop
+    is free to run other tasks between chunks. Each distinct value is only
+    converted once per call. Series are converted in `executor` in one step.
+
+    Conversions in the default thread pool share the lookup tables cached by
+    `countrycode`. With a `ProcessPoolExecutor`, each worker process builds
+    and caches its own tables, and `custom_dict` must be picklable.
+
+    Example:
+    >>> await acountrycode(['DZA', 'CAN'], origin='iso3c', destination='iso2c')
+    ['DZ', 'CA']
+    """
+    # Imported here, as asyncio alone would triple the import time of the package
+    import asyncio
+
+    # Validate arguments and load the codelist before any work is offloaded
+    _check_n_jobs(n_jobs)
+    _, destination_list, _, _ = _resolve_arguments(origin, destination, custom_dict)
+    _detect_dataframe_libraries()
+    convert = functools.partial(
+        countrycode,
+        origin=origin,
+        destination=destination,
+        custom_dict=custom_dict,
+        n_jobs=n_jobs,
+    )
+
+    if isinstance(sourcevar, (str, int)) or (pl and isinstance(sourcevar, pl.Expr)):
+        return convert(sourcevar)
+
+    loop = asyncio.get_running_loop()
+    if (
+        (pl and isinstance(sourcevar, pl.series.series.Series))
+        or (pd and isinstance(sourcevar, pd.Series))
+        or (np and isinstance(sourcevar, np.ndarray))
+    ):
+        if len(sourcevar) < _ASYNC_INLINE_SIZE:
+            return convert(sourcevar)
+        return await loop.run_in_executor(executor, convert, sourcevar)
+
+    if not isinstance(sourcevar, (list, tuple)):
+        sourcevar = list(sourcevar)
+    if len(sourcevar) < _ASYNC_INLINE_SIZE:
+        return convert(sourcevar)
+
+    many = isinstance(destination_list, list)
+    memo = {}
+    out = []
+    for start in range(0, len(sourcevar), _ASYNC_CHUNK_SIZE):
+        chunk = sourcevar[start : start + _ASYNC_CHUNK_SIZE]
+        keys, hashable = _distinct_keys(chunk)
+        keys = [key for key in keys if key not in memo]
+        if keys:
+            values = await loop.run_in_executor(executor, convert, keys)
+            if many:
+                values = zip(*values.values())
+            memo.update(zip(keys, values))
+        else:
+            await asyncio.sleep(0)
+        out.extend(_broadcast(chunk, memo.get, hashable))
+
+    if not many:
+        return out
+    missing = (None,) * len(destination_list)
+    return {
+        name: [(row or missing)[position] for row in out]
+        for position, name in enumerate(destination_list)
+    }
+
+
+def get_first_match(pattern, string_list):
+    for string in string_list:
+        match = pattern.search(string)
+        if match:
+            return match.group()
+    return None
+
+
+# Bounded cache of lookup structures derived from a codelist, keyed by
+# (kind, id(codelist), origin, destination). Each entry keeps a reference to
+# the codelist it was built from, so that the id cannot be recycled while the
+# entry is alive. Tables are never modified once cached, and the cache itself
+# is replaced rather than updated (see `_codelist_cache`), so hits take no
+# lock. The oldest entries are evicted first.
+_LOOKUP_CACHE_SIZE = 128
+_lookup_cache = {}
+
+
+def _cached_lookup(kind, codelist, origin, destination, build):
+    global _lookup_cache
+    key = (kind, id(codelist), origin, destination)
+    entry = _lookup_cache.get(key)
+    if entry is not None and entry[0] is codelist:
+        return entry[1]
+
+    # Build outside the lock; when two threads race, the first table published
+    # wins and the other is discarded, so every caller sees the same table
+    table = build(origin, destination, codelist)
+    with _cache_lock:
+        entry = _lookup_cache.get(key)
+        if entry is not None and entry[0] is codelist:
+            return entry[1]
+        cache = dict(_lookup_cache)
+        cache[key] = (codelist, table)
+        while len(cache) > _LOOKUP_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        _lookup_cache = cache
+    return table
+
+
+def clear_lookup_cache(custom_dict=None):
+    """
+    Drop cached lookup tables and compiled regexes.
+
+    Lookup tables are cached by codelist identity, so a custom dict that is
+    modified in place keeps being served from stale tables until it is
+    invalidated with this function.
+
+    Parameters:
+    custom_dict (dict, polars.DataFrame, str, or Path, optional):
+        If None (default), drop every cached lookup table. If a dict or a
+        DataFrame, drop only the tables built from it. If a path, drop only the tables built
+        from the codelist cached for that file.
+    """
+    global _lookup_cache
+    if custom_dict is None:
+        with _cache_lock:
+            _lookup_cache = {}
+        return
+
+    if isinstance(custom_dict, (str, Path)):
+        entry = _codelist_cache.get(str(Path(custom_dict).resolve()))
+        if entry is None:
+            return
+        custom_dict = entry[1]
+
+    with _cache_lock:
+        # A dict's tables are built from its snapshot, so drop those as well
+        sources = [custom_dict]
+        for (kind, *_), (source, table) in _lookup_cache.items():
+            if kind == "frozen" and source is custom_dict:
+                sources.append(table)
+        _lookup_cache = {
+            key: entry
+            for key, entry in _lookup_cache.items()
+            if not any(entry[0] is source for source in sources)
+        }
+
+
+def _as_output(value):
+    """
+    Convert digit-only strings to `int`, as `countrycode` does for all outputs.
+    """
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return value
+
+
+def _build_exact_table(origin, destination, codelist):
+    """
+    Map each origin value to its destination value. Rows where either value is
+    None are skipped, and the first row wins when an origin value repeats.
+    """
+    table = {}
+    for origin_i, destination_i in zip(codelist[origin], codelist[destination]):
+        if origin_i is None or destination_i is None:
+            continue
+        if origin_i not in table:
+            table[origin_i] = _as_output(destination_i)
+    return table
+
+
+def _exact_table(origin, destination, codelist):
+    return _cached_lookup("exact", codelist, origin, destination, _build_exact_table)
+
+
+_MATRIX_PATH = os.path.join(pkg_dir, "data", "matrix.pickle")
+_MATRIX_VERSION = 1
+_matrix = None
+
+
+def _load_matrix_rows(origin, destination, codelist):
+    """
+    Precomputed row index of `origin`, mapping each origin value to its row,
+    or None if it was built from a different origin column or is not
+    available. See `countrycode.matrix`.
+    """
+    global _matrix
+    matrix = _matrix
+    if matrix is None:
+        try:
+            with open(_MATRIX_PATH, "rb") as f:
+                matrix = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            matrix = {}
+        if isinstance(matrix, dict) and matrix.get("version") == _MATRIX_VERSION:
+            matrix = matrix["origins"]
+        else:
+            matrix = {}
+        _matrix = matrix
+    entry = matrix.get(origin)
+    if entry is None or origin not in codelist:
+        return None
+    if entry["digest"] != _digest(codelist[origin]):
+        return None
+    return entry["rows"]
+
+
+def _matrix_rows(origin, codelist):
+    return _cached_lookup("matrix", codelist, origin, None, _load_matrix_rows)
+
+
+# Largest code of a dense lookup table. Integer origins with larger or
+# negative codes use the dict-based `_exact_table` only.
+_DENSE_MAX_CODE = 1 << 20
+
+
+def _build_dense_table(origin, destination, codelist):
+    """
+    Dense lookup table for an integer origin, or None if the origin column
+    holds anything but integers between 0 and `_DENSE_MAX_CODE`.
+
+    Returns a pair `(rows, values)`. `rows` is an `array('l')` indexed by code,
+    holding the row whose destination value `replace_exact` returns for that
+    code, or -1. `values` holds that destination value for each such row, and
+    None for every other row.
+    """
+    pairs = [
+        (row, code)
+        for row, (code, value) in enumerate(
+            zip(codelist[origin], codelist[destination])
+        )
+        if code is not None and value is not None
+    ]
+    if not all(type(code) is int and 0 <= code <= _DENSE_MAX_CODE for _, code in pairs):
+        return None
+
+    rows = array("l", [-1]) * (max((code for _, code in pairs), default=0) + 1)
+    values = [None] * len(codelist[destination])
+    column = codelist[destination]
+    for row, code in pairs:
+        if rows[code] == -1:
+            rows[code] = row
+            values[row] = _as_output(column[row])
+    return rows, tuple(values)
+
+
+def _dense_table(origin, destination, codelist):
+    return _cached_lookup("dense", codelist, origin, destination, _build_dense_table)
+
+
+def _dense_rows(table, codes):
+    """
+    Look integer NumPy `codes` up in the `rows` of a dense table, vectorized.
+    Codes missing from the table have row -1.
+    """
+    rows = np.frombuffer(table, dtype=np.dtype("l"))
+    out = np.full(codes.shape, -1, dtype=np.intp)
+    inside = (codes >= 0) & (codes < len(rows))
+    out[inside] = rows[codes[inside]]
+    return out
+
+
+def _numpy_take(values, indices):
+    """
+    NumPy array of `values` taken at `indices`, where index -1 takes None.
+
+    The dtype is `int64` or unicode when the values taken are all integers or
+    all strings, and object otherwise. None entries of `values` that are
+    never taken do not count.
+    """
+    if (indices >= 0).all():
+        taken = np.zeros(len(values), dtype=bool)
+        taken[indices] = True
+        kinds = {type(value) for value, used in zip(values, taken) if used}
+        if kinds == {int}:
+            dtype, fill = np.int64, 0
+        elif kinds == {str}:
+            dtype, fill = np.str_, ""
+        else:
+            dtype = None
+        if dtype is not None:
+            values = [fill if value is None else value for value in values]
+            return np.array(values, dtype=dtype)[indices]
+    # Index -1 takes the trailing None
+    out = np.empty(len(values) + 1, dtype=object)
+    out[:-1] = values
+    return out[indices]
+
+
+def _numpy_unique(sourcevar):
+    """
+    Return the distinct values of a NumPy array, as a list of Python objects,
+    and the index of each element of the flattened array in that list. Returns
+    None if the values cannot be sorted, e.g. strings mixed with None.
+    """
+    try:
+        uniques, inverse = np.unique(sourcevar.ravel(), return_inverse=True)
+    except TypeError:
+        return None
+    return uniques.tolist(), inverse.ravel()
+
+
+def replace_numpy(
+    sourcevar, origin, destination, codelist, regex=False, n_jobs=None, executor=None
+):
+    """
+    Convert a NumPy array by converting its unique values only.
+
+    Integer arrays from an integer origin are looked up in a dense table.
+    Other arrays go through `np.unique`, the uniques are converted with
+    `replace_exact` or `replace_regex`, and the results are taken back into an
+    array of the same shape. See `_numpy_take` for the output dtype.
+    """
+    if not regex and sourcevar.dtype.kind in "iu":
+        table = _dense_table(origin, destination, codelist)
+        if table is not None:
+            rows, values = table
+            rows = _dense_rows(rows, sourcevar.ravel())
+            return _numpy_take(values, rows).reshape(sourcevar.shape)
+
+    factorized = _numpy_unique(sourcevar)
+    if factorized is None:
+        uniques = sourcevar.ravel().tolist()
+        inverse = np.arange(len(uniques))
+    else:
+        uniques, inverse = factorized
+    if regex:
+        converted = replace_regex(
+            uniques, origin, destination, codelist, n_jobs, executor
+        )
+    else:
+        converted = replace_exact(uniques, origin, destination, codelist)
+    return _numpy_take(converted, inverse).reshape(sourcevar.shape)
+
+
+def _unique_then_broadcast(sourcevar, convert):
+    """
+    Apply `convert` to the distinct values of `sourcevar` and broadcast the
+    results back to every position, in order.
+
+    `convert` receives a list of distinct, hashable, non-None values and must
+    return a list of outputs of the same length. None and unhashable inputs
+    cannot match any codelist entry and are mapped to None without being
+    passed to `convert`.
+    """
+    if not isinstance(sourcevar, (list, tuple)):
+        sourcevar = list(sourcevar)
+    keys, hashable = _distinct_keys(sourcevar)
+    return _broadcast(sourcevar, dict(zip(keys, convert(keys))).get, hashable)
+
+
+def _distinct_keys(values):
+    """
+    Distinct, hashable, non-None elements of `values` in order of first
+    appearance, and whether every element is hashable.
+    """
+    try:
+        uniques = dict.fromkeys(values)
+        hashable = True
+    except TypeError:
+        uniques = {}
+        for value in values:
+            try:
+                uniques[value] = None
+            except TypeError:
+                pass
+        hashable = False
+    uniques.pop(None, None)
+    return list(uniques), hashable
+
+
+def _broadcast(values, get, hashable):
+    """
+    Look every element of `values` up with `get`, mapping unhashable elements
+    to None.
+    """
+    if hashable:
+        return [get(value) for value in values]
+
+    out = []
+    for value in values:
+        try:
+            out.append(get(value))
+        except TypeError:
+            out.append(None)
+    return out
+
+
+def replace_exact(sourcevar, origin, destination, codelist):
+    rows = _matrix_rows(origin, codelist)
+    if rows is not None:
+        column = codelist[destination]
+
+        def convert(keys):
+            out = []
+            for key in keys:
+                row = rows.get(key)
+                out.append(None if row is None else _as_output(column[row]))
+            return out
+
+        return _unique_then_broadcast(sourcevar, convert)
+
+    get = _exact_table(origin, destination, codelist).get
+    return _unique_then_broadcast(sourcevar, lambda keys: [get(key) for key in keys])
+
+
+def _build_regex_table(origin, destination, codelist):
+    """
+    Compile the origin patterns, in codelist order, paired with their
+    destination values. Rows where either value is None are skipped.
+    """
+    return tuple(
+        (re.compile(val_origin, flags=re.IGNORECASE), _as_output(val_destination))
+        for val_origin, val_destination in zip(codelist[origin], codelist[destination])
+        if val_origin is not None and val_destination is not None
+    )
+
+
+def _regex_table(origin, destination, codelist):
+    return _cached_lookup("regex", codelist, origin, destination, _build_regex_table)
+
+
+def _regex_values(origin, destination, codelist):
+    """
+    Destination values of `_regex_table`, in order, without compiling it.
+    """
+    return [
+        _as_output(val_destination)
+        for val_origin, val_destination in zip(codelist[origin], codelist[destination])
+        if val_origin is not None and val_destination is not None
+    ]
+
+
+# Non-ASCII characters that match an ASCII letter under re.IGNORECASE but do not
+# lowercase to it. Folding inputs with this table and `str.lower` guarantees that
+# any ASCII literal matched case-insensitively also appears in the folded input.
+_FOLD_TABLE = str.maketrans(
+    {"\u0130": "i", "\u0131": "i", "\u212a": "k", "\u017f": "s"}
+)
+
+_REPEAT_OPCODES = {
+    getattr(sre_parse, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(sre_parse, name)
+}
+
+
+def _required_literals(parsed):
+    """
+    Return a set of lowercase ASCII strings, at least one of which appears in
+    every string matched by the parsed regex, or None if no such set was found.
+    """
+    options = []
+    run = []
+
+    def flush():
+        if run:
+            options.append({"".join(run)})
+            run.clear()
+
+    for op, av in parsed:
+        if op is sre_parse.LITERAL and av < 128:
+            run.append(chr(av).lower())
+            continue
+        flush()
+        required = None
+        if op is sre_parse.SUBPATTERN:
+            required = _required_literals(av[-1])
+        elif op is getattr(sre_parse, "ATOMIC_GROUP", None):
+            required = _required_literals(av)
+        elif op is sre_parse.ASSERT:
+            required = _required_literals(av[1])
+        elif op is sre_parse.BRANCH:
+            branches = [_required_literals(branch) for branch in av[1]]
+            if all(branch is not None for branch in branches):
+                required = set().union(*branches)
+        elif op in _REPEAT_OPCODES and av[0] >= 1:
+            required = _required_literals(av[2])
+        if required:
+            options.append(required)
+    flush()
+
+    if not options:
+        return None
+    # The most selective option is the one whose shortest literal is longest
+    return max(options, key=lambda option: (min(map(len, option)), -len(option)))
+
+
+class _RegexMatcher:
+    """
+    First-match-wins regex engine with a literal prefilter.
+
+    Each pattern is analysed once to find literals that any match must contain.
+    Literals are indexed by their first two characters, so a string is only
+    tested against the patterns whose literals it contains, in codelist order.
+    Patterns without a usable literal are always tested. The result is
+    identical to trying every pattern in turn.
+
+    Strings found in `shortcut`, under their `_name_key`, resolve with a single
+    dict lookup instead. See `_name_shortcut`.
+
+    `table` is a sequence of (compiled regex, value) pairs, or a function
+    returning one. A function is only called when a string misses the
+    shortcut, so inputs that all hit it never compile a regex.
+    """
+
+    __slots__ = ("_source", "_index", "shortcut")
+
+    def __init__(self, table, shortcut=None):
+        self.shortcut = shortcut or {}
+        self._source = table
+        self._index = None
+        if not callable(table):
+            self._build_index()
+
+    def _build_index(self):
+        index = self._index
+        if index is not None:
+            return index
+        table = self._source() if callable(self._source) else self._source
+        always = []
+        short = []
+        by_bigram = {}
+        for position, (regex, _) in enumerate(table):
+            try:
+                literals = _required_literals(
+                    sre_parse.parse(regex.pattern, regex.flags)
+                )
+            except Exception:
+                literals = None
+            if literals is None:
+                always.append(position)
+                continue
+            for literal in literals:
+                if len(literal) < 2:
+                    short.append((literal, position))
+                else:
+                    by_bigram.setdefault(literal[:2], {}).setdefault(
+                        literal, []
+                    ).append(position)
+        # Publish the frozen index in one assignment, so that threads racing
+        # to build it never see it half built
+        index = self._index = (
+            tuple(table),
+            tuple(always),
+            tuple(short),
+            {
+                bigram: {
+                    literal: tuple(positions) for literal, positions in group.items()
+                }
+                for bigram, group in by_bigram.items()
+            },
+        )
+        return index
+
+    @property
+    def table(self):
+        return self._build_index()[0]
+
+    @property
+    def always(self):
+        return self._build_index()[1]
+
+    def candidates(self, string):
+        """
+        Positions of the patterns that may match `string`, in codelist order.
+        Every other pattern is guaranteed not to match.
+        """
+        _, always, short, by_bigram = self._index or self._build_index()
+        folded = string.translate(_FOLD_TABLE).lower()
+        candidates = set(always)
+        for literal, position in short:
+            if literal in folded:
+                candidates.add(position)
+        for bigram in {folded[i : i + 2] for i in range(len(folded) - 1)}:
+            group = by_bigram.get(bigram)
+            if group:
+                for literal, positions in group.items():
+                    if literal in folded:
+                        candidates.update(positions)
+        return sorted(candidates)
+
+    def match(self, string):
+        """
+        Return the destination value of the first matching pattern, or None.
+        """
+        if not isinstance(string, str):
+            raise TypeError(f"expected string, got {type(string)}")
+        if self.shortcut:
+            value = self.shortcut.get(_name_key(string), _NO_SHORTCUT)
+            if value is not _NO_SHORTCUT:
+                return value
+        table = (self._index or self._build_index())[0]
+        for position in self.candidates(string):
+            regex, value = table[position]
+            if regex.search(string):
+                return value
+        return None
+
+    def match_all(self, string):
+        """
+        Return the destination values of every matching pattern, in order,
+        ignoring the shortcut.
+        """
+        table = self.table
+        return [
+            table[position][1]
+            for position in self.candidates(string)
+            if table[position][0].search(string)
+        ]
+
+
+def _name_key(string):
+    """
+    Key of `string` in the shortcut table of a `_RegexMatcher`.
+
+    ASCII strings are lowercased, which never changes the result of a match:
+    every pattern is compiled with `re.IGNORECASE`, under which an ASCII
+    character and its lowercase form are interchangeable. Other
+    normalizations would: stripping whitespace breaks anchored patterns, and
+    removing diacritics or case-folding non-ASCII text turns unmatched names
+    like "Haití" or "İtalya" into matches or vice versa. Non-ASCII strings are
+    therefore looked up verbatim.
+    """
+    return string.lower() if string.isascii() else string
+
+
+_NO_SHORTCUT = object()
+
+
+def _alias_columns(origin, codelist):
+    """
+    Name columns in the language of a regex origin, e.g. `country.name.en`
+    and `cldr.*.en` for `country.name.en.regex`.
+    """
+    language = origin[len("country.name.") : -len(".regex")]
+    names = [f"country.name.{language}"]
+    names += [f"cldr.{kind}.{language}" for kind in ("name", "short", "variant")]
+    return [name for name in names if name in codelist]
+
+
+def _name_shortcut(matcher, origin, codelist):
+    """
+    Resolve every name of the origin's name columns with `matcher`, keyed by
+    `_name_key`. Lookups in this table give the same result as `matcher`, so
+    canonical names and known aliases skip the regexes.
+    """
+    shortcut = {}
+    for column in _alias_columns(origin, codelist):
+        for name in codelist[column]:
+            if isinstance(name, str):
+                key = _name_key(name)
+                if key not in shortcut:
+                    shortcut[key] = matcher.match(name)
+    return shortcut
+
+
+def _build_regex_matcher(origin, destination, codelist):
+    # A name whose first matching row has a value for `destination` resolves
+    # to that value; otherwise that row is absent from `table` and the name is
+    # left to the regexes
+    rows = _cached_lookup("regex_rows", codelist, origin, None, _build_regex_rows)
+    column = codelist[destination]
+    shortcut = {}
+    for key, row in rows.shortcut.items():
+        if row is None:
+            shortcut[key] = None
+        elif column[row] is not None:
+            shortcut[key] = _as_output(column[row])
+    table = functools.partial(_regex_table, origin, destination, codelist)
+    return _RegexMatcher(table, shortcut)
+
+
+def _regex_matcher(origin, destination, codelist):
+    return _cached_lookup(
+        "regex_matcher", codelist, origin, destination, _build_regex_matcher
+    )
+
+
+# Alias tables precomputed by `csv2pickle.py`, see `countrycode.aliases`. The
+# version is bumped whenever `_name_key` or the regex engine changes.
+_ALIASES_PATH = os.path.join(pkg_dir, "data", "aliases.json")
+_ALIASES_VERSION = 1
+_aliases = None
+
+
+def _precomputed_aliases(origin, codelist):
+    """
+    Precomputed alias table for `origin`, mapping `_name_key`s to rows, or
+    None if it was built from a different origin column or is not available.
+    """
+    global _aliases
+    aliases = _aliases
+    if aliases is None:
+        try:
+            with open(_ALIASES_PATH, encoding="utf-8") as f:
+                aliases = json.load(f)
+        except (OSError, ValueError):
+            aliases = {}
+        if aliases.get("version") == _ALIASES_VERSION:
+            aliases = aliases["origins"]
+        else:
+            aliases = {}
+        _aliases = aliases
+    entry = aliases.get(origin)
+    if entry is None or origin not in codelist:
+        return None
+    if entry["digest"] != _digest(codelist[origin]):
+        return None
+    return entry["rows"]
+
+
+def _digest(value):
+    """
+    SHA-256 digest of a JSON-serializable value, e.g. codelist columns.
+    """
+    payload = json.dumps(value, ensure_ascii=False, default=repr)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# Matchers built in worker processes (or threads, with a thread executor),
+# keyed by a digest of the patterns and values they were compiled from. Like
+# `_lookup_cache`, the cache is replaced rather than updated, and its oldest
+# entries are evicted first.
+_worker_matchers = {}
+_WORKER_MATCHERS_SIZE = 16
+
+# Below this number of distinct strings, `n_jobs` is ignored
+_PARALLEL_MIN_STRINGS = 1000
+
+
+def _worker_matcher(key, table):
+    global _worker_matchers
+    matcher = _worker_matchers.get(key)
+    if matcher is not None:
+        return matcher
+
+    compiled = [
+        (re.compile(pattern, flags=flags), value) for pattern, flags, value in table
+    ]
+    matcher = _RegexMatcher(compiled)
+    with _cache_lock:
+        cache = dict(_worker_matchers)
+        matcher = cache.setdefault(key, matcher)
+        while len(cache) > _WORKER_MATCHERS_SIZE:
+            del cache[next(iter(cache))]
+        _worker_matchers = cache
+    return matcher
+
+
+def _init_regex_worker(key, table):
+    # Compile the patterns once per worker, before any chunk arrives
+    _worker_matcher(key, table)
+
+
+def _match_in_worker(key, table, strings):
+    match = _worker_matcher(key, table).match
+    return [match(string) for string in strings]
+
+
+def _check_n_jobs(n_jobs):
+    """
+    Raise ValueError unless `n_jobs` is None, -1, or a positive integer.
+    """
+    if n_jobs is None:
+        return
+    # bool is a subclass of int, but n_jobs=True is almost certainly a mistake
+    if type(n_jobs) is not int or (n_jobs < 1 and n_jobs != -1):
+        raise ValueError("n_jobs must be None, -1, or a positive integer")
+
+
+def _parallel_match(strings, matcher, n_jobs=None, executor=None):
+    """
+    Resolve distinct strings with `matcher`, sharded across worker processes.
+
+    Strings are split into contiguous chunks which are mapped in order, so the
+    output is identical to `[matcher.match(s) for s in strings]`. With
+    `n_jobs`, a `ProcessPoolExecutor` is created for the call and its workers
+    compile the patterns once in their initializer. With `executor`, the
+    patterns are sent with each chunk and compiled once per worker.
+    """
+    if executor is None and (
+        n_jobs is None or n_jobs == 1 or len(strings) < _PARALLEL_MIN_STRINGS
+    ):
+        return [matcher.match(string) for string in strings]
+    if not strings:
+        return []
+
+    table = tuple((regex.pattern, regex.flags, value) for regex, value in matcher.table)
+    # The key identifies the table's content, so it is never served for
+    # another table, even in a long-lived executor
+    key = _digest(table)
+
+    if executor is not None:
+        workers = getattr(executor, "_max_workers", None) or os.cpu_count() or 1
+    else:
+        workers = (os.cpu_count() or 1) if n_jobs == -1 else n_jobs
+
+    # A few chunks per worker balances the load between workers
+    size = -(-len(strings) // (workers * 4))
+    chunks = [strings[i : i + size] for i in range(0, len(strings), size)]
+
+    if executor is not None:
+        results = executor.map(
+            _match_in_worker,
+            [key] * len(chunks),
+            [table] * len(chunks),
+            chunks,
+        )
+        return [value for chunk in results for value in chunk]
+
+    # Imported here, as most programs never match in worker processes
+    import concurrent.futures
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_regex_worker, initargs=(key, table)
+    ) as pool:
+        results = pool.map(
+            _match_in_worker, [key] * len(chunks), [None] * len(chunks), chunks
+        )
+        return [value for chunk in results for value in chunk]
+
+
+def _regex_converter(origin, destination, codelist, n_jobs=None, executor=None):
+    """
+    Function converting a list of distinct strings with the regex engine, in
+    the current process or in worker processes, through the persistent memo
+    if one is set.
+    """
+    matcher = _regex_matcher(origin, destination, codelist)
+    if (n_jobs is None or n_jobs == 1) and executor is None:
+        match = matcher.match
+
+        def convert(keys):
+            return [match(key) for key in keys]
+
+    else:
+
+        def convert(keys):
+            return _parallel_match(keys, matcher, n_jobs, executor)
+
+    memo = _regex_memo
+    if memo is None:
+        return convert
+    digest = _cached_lookup(
+        "regex_digest", codelist, origin, destination, _build_regex_digest
+    )
+
+    def convert_with_memo(keys):
+        found = memo.lookup(
+            digest, origin, destination, [key for key in keys if type(key) is str]
+        )
+        missing = [key for key in keys if key not in found]
+        if missing:
+            resolved = list(zip(missing, convert(missing)))
+            memo.store(digest, origin, destination, resolved)
+            found.update(resolved)
+        return [found[key] for key in keys]
+
+    return convert_with_memo
+
+
+# Persistent memo of regex resolutions, see `set_regex_memo`
+_regex_memo = None
+
+# Part of every memo key; bump it when a change to the regex engine could
+# change the result of a conversion
+_REGEX_MEMO_VERSION = 1
+
+
+def set_regex_memo(path):
+    """
+    Remember regex resolutions in a SQLite database, across processes.
+
+    Conversions from regex origins such as `country.name` look each distinct
+    string up in the database at `path` before matching it, and store new
+    resolutions there. Entries are keyed by a digest of the codelist's origin
+    and destination columns, so results computed from a different or edited
+    codelist are never served. `Converter`, `iter_convert` and conversions to
+    several destinations keep their in-memory caches only.
+
+    Parameters:
+    path (str, Path, or None): Database file, created if needed. None disables
+        the memo.
+
+    Returns:
+    countrycode.memo.RegexMemo or None: The memo in use, which can be cleared
+    with its `clear` method.
+    """
+    global _regex_memo
+    if path is None:
+        _regex_memo = None
+        return None
+    from .memo import RegexMemo
+
+    _regex_memo = RegexMemo(path)
+    return _regex_memo
+
+
+def _build_regex_digest(origin, destination, codelist):
+    """
+    Digest of the columns a regex conversion depends on.
+    """
+    columns = [list(codelist[origin]), list(codelist[destination])]
+    return _digest([_REGEX_MEMO_VERSION, columns])
+
+
+def replace_regex(sourcevar, origin, destination, codelist, n_jobs=None, executor=None):
+    convert = _regex_converter(origin, destination, codelist, n_jobs, executor)
+    return _unique_then_broadcast(sourcevar, convert)
+
+
+def _polars_dtype(values):
+    """
+    Polars dtype for a column of conversion outputs, or None if mixed.
+    """
+    kinds = {type(value) for value in values}
+    if not kinds or kinds == {str}:
+        return pl.String
+    if kinds == {int}:
+        return pl.Int64
+    return None
+
+
+def _polars_keys(table, dtype):
+    """
+    Lookup table whose keys can all be compared with a Polars `dtype`.
+    Returns None if the dtype is not supported natively, or if any key has
+    another type, e.g. float codes for an integer Series: such keys can still
+    compare equal to the values, so the generic path must be used.
+    """
+    if dtype == pl.String:
+        kind = str
+    elif dtype.is_integer():
+        kind = int
+    else:
+        return None
+    if any(type(key) is not kind for key in table):
+        return None
+    return table
+
+
+def replace_polars(
+    sourcevar, origin, destination, codelist, regex=False, n_jobs=None, executor=None
+):
+    """
+    Convert a Polars Series without materializing it as a Python list.
+
+    Exact conversions are a single `replace_strict` against the lookup table.
+    Regex conversions resolve each unique string once and broadcast the
+    results with `replace_strict`. The name and null mask of `sourcevar` are
+    preserved. Returns None if the dtype of `sourcevar` or of the destination
+    values is not supported natively, in which case callers should fall back to
+    `replace_exact` or `replace_regex`.
+    """
+    if sourcevar.dtype == pl.Categorical:
+        sourcevar = sourcevar.cast(pl.String)
+
+    if regex:
+        if sourcevar.dtype != pl.String:
+            return None
+        return_dtype = _polars_dtype(_regex_values(origin, destination, codelist))
+        if return_dtype is None:
+            return None
+        uniques = sourcevar.drop_nulls().unique().to_list()
+        convert = _regex_converter(origin, destination, codelist, n_jobs, executor)
+        table = dict(zip(uniques, convert(uniques)))
+    else:
+        table = _exact_table(origin, destination, codelist)
+        return_dtype = _polars_dtype(table.values())
+        table = _polars_keys(table, sourcevar.dtype)
+        if return_dtype is None or table is None:
+            return None
+        # Codes such as 700 do not fit narrow integer dtypes, so compare as
+        # Int64; values too large for it cannot be codes and become null
+        if sourcevar.dtype.is_integer() and sourcevar.dtype != pl.Int64:
+            sourcevar = sourcevar.cast(pl.Int64, strict=False)
+
+    return sourcevar.replace_strict(
+        list(table.keys()),
+        list(table.values()),
+        default=None,
+        return_dtype=return_dtype,
+    )
+
+
+def replace_polars_expr(
+    sourcevar, origin, destination, codelist, regex=False, n_jobs=None, executor=None
+):
+    """
+    Wrap `replace_polars` in a Polars expression, for use in `select`,
+    `with_columns` and lazy queries.
+    """
+    if regex:
+        values = _regex_values(origin, destination, codelist)
+    else:
+        values = _exact_table(origin, destination, codelist).values()
+    return_dtype = _polars_dtype(values)
+    if return_dtype is None:
+        return_dtype = pl.Object
+
+    def convert(series):
+        out = replace_polars(
+            series, origin, destination, codelist, regex, n_jobs, executor
+        )
+        if out is not None:
+            return out
+        series_list = series.to_list()
+        if regex:
+            out = replace_regex(
+                series_list, origin, destination, codelist, n_jobs, executor
+            )
+        else:
+            out = replace_exact(series_list, origin, destination, codelist)
+        return pl.Series(series.name, out, dtype=return_dtype)
+
+    return sourcevar.map_batches(
+        convert, return_dtype=return_dtype, is_elementwise=True
+    )
+
+
+def _pandas_dtype(values):
+    """
+    Nullable pandas dtype for a column of conversion outputs.
+    """
+    kinds = {type(value) for value in values}
+    if not kinds or kinds == {str}:
+        return "string"
+    if kinds == {int}:
+        return "Int64"
+    return object
+
+
+def _replace_pandas_int(sourcevar, origin, destination, codelist):
+    """
+    Convert a Series of integers, nullable or not, with a dense lookup table,
+    without boxing the codes. Returns None if the origin has no dense table.
+    """
+    table = _dense_table(origin, destination, codelist)
+    if table is None:
+        return None
+    rows, values = table
+    # Missing codes have row -1, as do codes absent from the table
+    codes = sourcevar.to_numpy(dtype=np.int64, na_value=-1)
+    rows = _dense_rows(rows, codes)
+
+    dtype = _pandas_dtype(_exact_table(origin, destination, codelist).values())
+    if dtype == "Int64":
+        integers = np.array([value or 0 for value in values], dtype=np.int64)
+        converted = pd.arrays.IntegerArray(integers[rows], rows < 0)
+    else:
+        # Row -1 takes the trailing None
+        converted = pd.array(list(values) + [None], dtype=dtype).take(rows)
+    return pd.Series(converted, index=sourcevar.index, name=sourcevar.name)
+
+
+def replace_pandas(
+    sourcevar, origin, destination, codelist, regex=False, n_jobs=None, executor=None
+):
+    """
+    Convert a pandas Series by converting its unique values only.
+
+    The Series is factorized (or its categorical codes are used directly), the
+    uniques are converted with `replace_exact` or `replace_regex`, and the
+    results are broadcast back with a vectorized take. The index and name of
+    `sourcevar` are preserved and missing values stay missing. Returns None if
+    the values cannot be factorized, in which case callers should fall back to
+    the list-based path.
+    """
+    if not regex and pd.api.types.is_signed_integer_dtype(sourcevar.dtype):
+        out = _replace_pandas_int(sourcevar, origin, destination, codelist)
+        if out is not None:
+            return out
+
+    if isinstance(sourcevar.dtype, pd.CategoricalDtype):
+        codes = sourcevar.cat.codes.to_numpy()
+        uniques = sourcevar.cat.categories.tolist()
+    else:
+        try:
+            codes, uniques = pd.factorize(sourcevar)
+        except TypeError:
+            return None
+        uniques = uniques.tolist()
+
+    if regex:
+        values = _regex_values(origin, destination, codelist)
+        converted = replace_regex(
+            uniques, origin, destination, codelist, n_jobs, executor
+        )
+    else:
+        values = _exact_table(origin, destination, codelist).values()
+        converted = replace_exact(uniques, origin, destination, codelist)
+
+    # Missing values have code -1, which takes the trailing None
+    converted = pd.array(converted + [None], dtype=_pandas_dtype(values))
+    return pd.Series(converted.take(codes), index=sourcevar.index, name=sourcevar.name)
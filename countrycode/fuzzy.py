@@ -0,0 +1,265 @@
+"""
+Fuzzy fallback for names that no regex matches.
+
+Typos and unusual transliterations ("Cananda", "Tuerkiye") are not matched by
+the regexes of the `country.name` origins. `fuzzy_countrycode` converts names
+with the regexes first, and resolves the misses to the codelist row with the
+most similar name in the name columns (`country.name.<language>`,
+`cldr.name.*` and `un.name.*`).
+
+Names are compared after case folding and removing diacritics and
+punctuation. An inverted index from character trigrams to names selects the
+few names sharing the most trigrams with the input, and only those are scored
+with `difflib.SequenceMatcher.ratio`, instead of comparing the input with
+every name.
+"""
+
+import itertools
+import sys
+import unicodedata
+from collections import Counter
+from difflib import SequenceMatcher
+
+from .countrycode import (
+    _REGEX_ORIGINS,
+    _as_output,
+    _cached_lookup,
+    _distinct_keys,
+    _locate_unique,
+    _regex_converter,
+    _resolve_arguments,
+)
+
+NAME_COLUMN_PREFIXES = ("cldr.name.", "un.name.")
+
+# Trigrams found in more than this share of the names, such as " re" or
+# "ia ", are too common to select candidates; they still count in the score.
+_COMMON_TRIGRAM_SHARE = 0.01
+
+# Number of names, by trigrams in common with the input, whose score is
+# computed
+_CANDIDATES = 6
+
+
+def _normalize(string):
+    """
+    Case-fold `string`, remove diacritics and replace punctuation by spaces.
+    """
+    decomposed = unicodedata.normalize("NFKD", string.casefold())
+    kept = "".join(
+        char if char.isalnum() else " "
+        for char in decomposed
+        if not unicodedata.combining(char)
+    )
+    return " ".join(kept.split())
+
+
+def _trigrams(normalized):
+    padded = f"  {normalized} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+class FuzzyIndex:
+    """
+    Trigram inverted index over the name columns of a codelist.
+
+    Built once per codelist and origin, and cached with the lookup tables.
+    """
+
+    def __init__(self, origin, codelist):
+        language = origin[len("country.name.") : -len(".regex")]
+        columns = [
+            column
+            for column in codelist
+            if column == f"country.name.{language}"
+            or column.startswith(NAME_COLUMN_PREFIXES)
+        ]
+        # Each distinct normalized name keeps the first row it appears in
+        rows = {}
+        for column in columns:
+            for row, name in enumerate(codelist[column]):
+                if isinstance(name, str):
+                    normalized = _normalize(name)
+                    if normalized and normalized not in rows:
+                        rows[normalized] = row
+        self.columns = columns
+        self.names = list(rows)
+        self.rows = list(rows.values())
+        self.trigrams = [_trigrams(name) for name in self.names]
+
+        postings = {}
+        for position, trigrams in enumerate(self.trigrams):
+            for trigram in trigrams:
+                postings.setdefault(trigram, []).append(position)
+        limit = max(1, int(len(self.names) * _COMMON_TRIGRAM_SHARE))
+        self.postings = {
+            trigram: tuple(positions)
+            for trigram, positions in postings.items()
+            if len(positions) <= limit
+        }
+
+    def best(self, string, allowed=None):
+        """
+        Return `(row, score)` for the name most similar to `string`, or
+        `(None, 0.0)` if no name shares an uncommon trigram with it.
+
+        Only rows for which `allowed(row)` is true are considered. Ties are
+        broken by codelist order.
+        """
+        normalized = _normalize(string)
+        if not normalized:
+            return None, 0.0
+        query = _trigrams(normalized)
+        counts = Counter(
+            itertools.chain.from_iterable(
+                self.postings[trigram] for trigram in query if trigram in self.postings
+            )
+        )
+        # Over-fetch so that enough candidates remain once rows are filtered
+        candidates = [
+            position
+            for position, _ in counts.most_common(4 * _CANDIDATES)
+            if allowed is None or allowed(self.rows[position])
+        ][:_CANDIDATES]
+
+        best_row, best_score = None, 0.0
+        matcher = SequenceMatcher(autojunk=False)
+        matcher.set_seq2(normalized)
+        for position in candidates:
+            row = self.rows[position]
+            matcher.set_seq1(self.names[position])
+            # `quick_ratio` is a cheap upper bound of `ratio`
+            if matcher.quick_ratio() < best_score:
+                continue
+            score = matcher.ratio()
+            if score > best_score or (score == best_score and row < best_row):
+                best_row, best_score = row, score
+        return best_row, best_score
+
+
+def _build_fuzzy_index(origin, destination, codelist):
+    return FuzzyIndex(origin, codelist)
+
+
+def fuzzy_countrycode(
+    sourcevar,
+    origin="country.name",
+    destination="country.name.en",
+    custom_dict=None,
+    threshold=0.8,
+    return_score=False,
+):
+    """
+    Convert country names, resolving names that no regex matches to the most
+    similar known name.
+
+    Names are converted with the regexes as in `countrycode`. Each distinct
+    string that no regex matches, whatever the destination, is compared with the names of the codelist's
+    name columns, and takes the destination value of the most similar one if
+    its similarity is at least `threshold`.
+
+    Parameters:
+    sourcevar (list, str, polars.Series, or pandas.Series):
+        Country names to convert.
+    origin (str, optional):
+        A regex origin, e.g. 'country.name' (default) or 'country.name.de'.
+    destination (str, optional):
+        The desired format of the output. Default is 'country.name.en'.
+    custom_dict (optional):
+        A custom dictionary, see `countrycode`.
+    threshold (float, optional):
+        Minimum similarity, between 0 and 1, of a fuzzy match. Default is 0.8.
+    return_score (bool, optional):
+        If True, also return the similarity of each match: 1.0 for regex
+        matches, the similarity for fuzzy matches, and None otherwise.
+
+    Returns:
+    The converted values, in the same container type as `countrycode`
+    returns, or a tuple `(values, scores)` of two such containers if
+    `return_score` is True.
+
+    Example:
+    >>> fuzzy_countrycode(['Cananda', 'Frnace'], destination='iso3c')
+    ['CAN', 'FRA']
+    """
+    if not 0 <= threshold <= 1:
+        raise ValueError("threshold must be between 0 and 1")
+    origin, destination, codelist, regex = _resolve_arguments(
+        origin, destination, custom_dict
+    )
+    if not regex or origin not in _REGEX_ORIGINS:
+        raise ValueError(
+            "fuzzy matching requires a regex origin: " + ", ".join(_REGEX_ORIGINS)
+        )
+    if isinstance(destination, list):
+        raise ValueError("fuzzy_countrycode requires a single destination column")
+
+    # Series can only exist once their library is imported
+    pl = sys.modules.get("polars")
+    pd = sys.modules.get("pandas")
+    if pl and isinstance(sourcevar, pl.Series):
+        values, scores = _fuzzy_convert(
+            sourcevar.to_list(), origin, destination, codelist, threshold
+        )
+        out = pl.Series(sourcevar.name, values), pl.Series(sourcevar.name, scores)
+    elif pd and isinstance(sourcevar, pd.Series):
+        values, scores = _fuzzy_convert(
+            sourcevar.to_list(), origin, destination, codelist, threshold
+        )
+        out = (
+            pd.Series(values, index=sourcevar.index, name=sourcevar.name),
+            pd.Series(scores, index=sourcevar.index, name=sourcevar.name),
+        )
+    elif isinstance(sourcevar, str):
+        values, scores = _fuzzy_convert(
+            [sourcevar], origin, destination, codelist, threshold
+        )
+        out = values[0], scores[0]
+    else:
+        out = _fuzzy_convert(sourcevar, origin, destination, codelist, threshold)
+    return out if return_score else out[0]
+
+
+def _fuzzy_convert(sourcevar, origin, destination, codelist, threshold):
+    """
+    Lists of values and scores for the elements of `sourcevar`.
+    """
+    if not isinstance(sourcevar, (list, tuple)):
+        sourcevar = list(sourcevar)
+    keys, _ = _distinct_keys(sourcevar)
+    keys = [key for key in keys if isinstance(key, str)]
+
+    # Only names that match no row at all are fuzzy matched. A name whose row
+    # has no destination value stays None, as in `countrycode`.
+    rows = _locate_unique(keys, origin, codelist, True)
+    matched = [key for key, row in zip(keys, rows) if row is not None]
+    misses = [key for key, row in zip(keys, rows) if row is None]
+    converted = _regex_converter(origin, destination, codelist)(matched)
+
+    resolved = {}
+    for key, value in zip(matched, converted):
+        if value is not None:
+            resolved[key] = (value, 1.0)
+
+    if misses:
+        index = _cached_lookup("fuzzy", codelist, origin, None, _build_fuzzy_index)
+        column = codelist[destination]
+
+        def allowed(row):
+            return column[row] is not None
+
+        for key in misses:
+            row, score = index.best(key, allowed)
+            if row is not None and score >= threshold:
+                resolved[key] = (_as_output(column[row]), score)
+
+    values = []
+    scores = []
+    for value in sourcevar:
+        try:
+            value, score = resolved.get(value, (None, None))
+        except TypeError:
+            value, score = None, None
+        values.append(value)
+        scores.append(score)
+    return values, scores
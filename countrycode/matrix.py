@@ -0,0 +1,67 @@
+"""
+Precomputed conversion matrix for the exact origins.
+
+The default codelist has a few hundred rows, so the row of every value of
+every code column is known ahead of time. The build step (`csv2pickle.py`)
+indexes each exact origin of `_VALID_ORIGINS` once, and `write_matrix` stores
+the indexes in `data/matrix.pickle`, shipped alongside the codelist:
+
+    {"version": 1, "origins": {origin: {"digest": ..., "rows": {value: row}}}}
+
+For each origin, `rows` maps every value of the origin column to its codelist
+row. Together with the destination columns this forms the full conversion
+matrix: converting a value is one dict lookup for its row, then one index into
+the destination column. `digest` identifies the origin column the index was
+built from, so that it is ignored for any other codelist.
+
+Origins where a value appears in several rows are left out, because their
+destination value depends on which of those rows has one.
+"""
+
+import pickle
+
+from .countrycode import _MATRIX_VERSION, _REGEX_ORIGINS, _VALID_ORIGINS, _digest
+
+
+def code_columns(codelist):
+    """
+    Names of the columns of `codelist` that are indexed: the exact origins.
+    Country name origins, such as 'country.name.de', are converted with their
+    regex column and are left out.
+    """
+    return [
+        column
+        for column in _VALID_ORIGINS
+        if column in codelist
+        and column not in _REGEX_ORIGINS
+        and column + ".regex" not in _REGEX_ORIGINS
+    ]
+
+
+def build_matrix(codelist):
+    """
+    Build the row index of every exact origin of `codelist`.
+
+    Returns:
+    dict: The content of `data/matrix.pickle`, see the module docstring.
+    """
+    origins = {}
+    for origin in code_columns(codelist):
+        rows = {}
+        for row, value in enumerate(codelist[origin]):
+            if value is None:
+                continue
+            if value in rows:
+                break
+            rows[value] = row
+        else:
+            origins[origin] = {"digest": _digest(codelist[origin]), "rows": rows}
+    return {"version": _MATRIX_VERSION, "origins": origins}
+
+
+def write_matrix(codelist, path):
+    """
+    Write the conversion matrix of `codelist` to `path`, as a pickle.
+    """
+    with open(path, "wb") as f:
+        pickle.dump(build_matrix(codelist), f)
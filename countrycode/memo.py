@@ -0,0 +1,107 @@
+"""
+Persistent on-disk memo of regex resolutions.
+
+Resolving a string against the regex origins is the most expensive step of a
+conversion. A `RegexMemo` stores resolutions in a SQLite database so that
+later processes can look them up instead of matching the same strings again.
+
+Entries are keyed by a digest of the codelist columns they were computed
+from, so editing a codelist file never serves stale results: the new digest
+simply misses, and the strings are matched again.
+"""
+
+import sqlite3
+import threading
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS regex_memo (
+    codelist TEXT NOT NULL,
+    origin TEXT NOT NULL,
+    destination TEXT NOT NULL,
+    input TEXT NOT NULL,
+    output,
+    PRIMARY KEY (codelist, origin, destination, input)
+) WITHOUT ROWID
+"""
+
+# Number of strings looked up per query, below SQLite's limit on parameters
+_BATCH_SIZE = 500
+
+# Output types that SQLite stores and returns unchanged
+_STORABLE = (str, int, float, type(None))
+
+
+class RegexMemo:
+    """
+    SQLite-backed store of regex resolutions, safe to share between threads
+    and processes.
+
+    Each thread uses its own connection to the database at `path`, which is
+    created if needed.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._local = threading.local()
+        self._connection().execute(_SCHEMA)
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.DatabaseError:
+                pass
+            self._local.connection = connection
+        return connection
+
+    def lookup(self, digest, origin, destination, strings):
+        """
+        Return a dict of the resolutions of `strings` found in the memo.
+        """
+        connection = self._connection()
+        found = {}
+        for start in range(0, len(strings), _BATCH_SIZE):
+            batch = strings[start : start + _BATCH_SIZE]
+            query = (
+                "SELECT input, output FROM regex_memo WHERE codelist = ? "
+                "AND origin = ? AND destination = ? AND input IN ({})"
+            ).format(", ".join("?" * len(batch)))
+            found.update(
+                connection.execute(query, (digest, origin, destination, *batch))
+            )
+        return found
+
+    def store(self, digest, origin, destination, resolutions):
+        """
+        Add the `(input, output)` pairs of `resolutions` to the memo. Pairs
+        whose output SQLite cannot store faithfully are skipped.
+        """
+        rows = [
+            (digest, origin, destination, string, output)
+            for string, output in resolutions
+            if isinstance(string, str) and type(output) in _STORABLE
+        ]
+        if not rows:
+            return
+        with self._connection() as connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO regex_memo VALUES (?, ?, ?, ?, ?)", rows
+            )
+
+    def clear(self):
+        """
+        Delete every stored resolution.
+        """
+        with self._connection() as connection:
+            connection.execute("DELETE FROM regex_memo")
+
+    def __len__(self):
+        (count,) = (
+            self._connection().execute("SELECT COUNT(*) FROM regex_memo").fetchone()
+        )
+        return count
+
+    def __repr__(self):
+        return f"RegexMemo({self.path!r})"
@@ -2,6 +2,10 @@ import polars as pl
 import pickle
 import os
 
+from countrycode.aliases import write_aliases
+from countrycode.columnar import write_columnar
+from countrycode.matrix import write_matrix
+
 # Read the CSV file
 df = pl.read_csv("countrycode/data/codelist.csv")
 
@@ -15,4 +19,13 @@ os.makedirs("countrycode/data", exist_ok=True)
 with open("countrycode/data/codelist.pickle", "wb") as f:
     pickle.dump(codelist, f)
 
-print("Successfully converted CSV to pickle file") 
\ No newline at end of file
+# Save in the columnar format, which is loaded lazily one column at a time
+write_columnar(codelist, "countrycode/data/codelist.columns")
+
+# Precompute the alias tables which resolve names without regexes
+write_aliases(codelist, "countrycode/data/aliases.json")
+
+# Precompute the row of every value of the exact origins
+write_matrix(codelist, "countrycode/data/matrix.pickle")
+
+print("Successfully converted CSV to pickle, columnar, alias and matrix files")
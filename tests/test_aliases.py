@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from countrycode import clear_lookup_cache, countrycode
+from countrycode.aliases import alias_columns, build_aliases
+from countrycode.countrycode import (
+    _ALIASES_PATH,
+    _build_regex_rows,
+    _cached_lookup,
+    _compile_rows,
+    _RegexMatcher,
+    prepare_codelist,
+)
+
+codelist = prepare_codelist(None)
+
+with open(_ALIASES_PATH, encoding="utf-8") as f:
+    shipped = json.load(f)
+
+
+@pytest.mark.parametrize("origin", sorted(shipped["origins"]))
+def test_shipped_aliases_resolve_like_the_regexes(origin):
+    rows = shipped["origins"][origin]["rows"]
+    assert len(rows) > 2000
+    matcher = _RegexMatcher(_compile_rows(origin, codelist))
+    for key, row in rows.items():
+        assert matcher.match(key) == row, key
+
+
+def test_shipped_aliases_match_the_codelist():
+    # Rebuild the table of one origin to check that the artifact is current
+    subset = {
+        column: codelist[column]
+        for column in ["country.name.en.regex", "country.name.en"]
+        + alias_columns(codelist)[:20]
+    }
+    built = build_aliases(subset)["origins"]["country.name.en.regex"]
+    expected = shipped["origins"]["country.name.en.regex"]
+    assert built["digest"] == expected["digest"]
+    assert built["rows"].items() <= expected["rows"].items()
+
+
+def test_aliases_resolve_without_compiling():
+    clear_lookup_cache()
+    names = ["Canada", "Côte d’Ivoire", "Republic of Korea", "KOREA, REPUBLIC OF"]
+    assert countrycode(names, "country.name", "iso3c") == ["CAN", "CIV", "KOR", "KOR"]
+    rows = _cached_lookup(
+        "regex_rows", codelist, "country.name.en.regex", None, _build_regex_rows
+    )
+    assert rows._index is None
+
+    # A miss compiles the regexes
+    assert countrycode("The Dominion of Canada", "country.name", "iso3c") == "CAN"
+
+
+def test_aliases_ignored_for_other_codelists():
+    custom_data = {
+        "country.name.en.regex": ["^canada$", "zzz"],
+        "country.name.en": ["Canada", "Nowhere"],
+        "code": ["A", "B"],
+    }
+    rows = _build_regex_rows("country.name.en.regex", None, custom_data)
+    assert rows.shortcut == {"canada": 0, "nowhere": None}
+    assert countrycode(
+        ["Canada", "France"], "country.name.en.regex", "code", custom_dict=custom_data
+    ) == ["A", None]
@@ -0,0 +1,86 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from countrycode import acountrycode, codelist, countrycode
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+names = [name for name in codelist["country.name.en"] if name is not None]
+large = (names + ["Atlantis", None]) * 100
+
+
+def test_acountrycode_small_inputs():
+    assert asyncio.run(acountrycode("DZA", "iso3c", "iso2c")) == "DZ"
+    assert asyncio.run(acountrycode(["DZA", "CAN"], "iso3c", "cown")) == [615, 20]
+    assert asyncio.run(acountrycode()) == ["Algeria", "Canada"]
+    with pytest.raises(ValueError, match="origin"):
+        asyncio.run(acountrycode(["DZA"], "bad origin", "iso2c"))
+
+
+def test_acountrycode_large_inputs_match_countrycode():
+    assert len(large) > 10000
+    out = asyncio.run(acountrycode(large, "country.name", "iso3c"))
+    assert out == countrycode(large, "country.name", "iso3c")
+
+    destinations = ["iso3c", "cown"]
+    out = asyncio.run(acountrycode(iter(large), "country.name", destinations))
+    assert out == countrycode(large, "country.name", destinations)
+
+    unhashable = large + [["Canada"]]
+    out = asyncio.run(acountrycode(unhashable, "country.name", "iso2c"))
+    assert out == countrycode(unhashable, "country.name", "iso2c")
+
+
+def test_acountrycode_keeps_the_loop_responsive():
+    async def main(executor):
+        ticks = 0
+        done = asyncio.Event()
+
+        async def tick():
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.create_task(tick())
+        out = await acountrycode(large, "country.name", "iso3c", executor=executor)
+        done.set()
+        await ticker
+        return out, ticks
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        out, ticks = asyncio.run(main(executor))
+    assert out == countrycode(large, "country.name", "iso3c")
+    # The other task ran while the chunks were converted in the executor
+    assert ticks > 1
+
+
+def test_acountrycode_process_executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        out = asyncio.run(
+            acountrycode(large, "country.name", "iso3c", executor=executor)
+        )
+    assert out == countrycode(large, "country.name", "iso3c")
+
+
+@pytest.mark.skipif(pl is None, reason="polars is not installed")
+def test_acountrycode_polars():
+    series = pl.Series("name", large)
+    out = asyncio.run(acountrycode(series, "country.name", "iso3c"))
+    assert out.equals(countrycode(series, "country.name", "iso3c"))
+
+
+@pytest.mark.skipif(pd is None, reason="pandas is not installed")
+def test_acountrycode_pandas():
+    series = pd.Series(large, name="name")
+    out = asyncio.run(acountrycode(series, "country.name", "iso3c"))
+    assert out.equals(countrycode(series, "country.name", "iso3c"))
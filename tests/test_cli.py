@@ -0,0 +1,110 @@
+import json
+
+import pytest
+
+from countrycode.cli import main
+
+try:
+    import polars as pl
+
+    _has_polars = True
+except ImportError:
+    _has_polars = False
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "input.csv"
+    path.write_text("id,country\n1,Canada\n2,alGeria\n3,\n4,Atlantis\n")
+    return path
+
+
+@pytest.mark.parametrize("engine", ["python", "polars"])
+def test_cli_csv(csv_file, tmp_path, engine):
+    if engine == "polars" and not _has_polars:
+        pytest.skip("Polars not installed")
+    output = tmp_path / "output.csv"
+    code = main(
+        [
+            str(csv_file),
+            "--column=country",
+            "--origin=country.name",
+            "--destination=iso3c",
+            f"--output={output}",
+            f"--engine={engine}",
+        ]
+    )
+    assert code == 0
+    assert output.read_text().splitlines() == [
+        "id,country,iso3c",
+        "1,Canada,CAN",
+        "2,alGeria,DZA",
+        "3,,",
+        "4,Atlantis,",
+    ]
+
+
+def test_cli_replaces_column_with_small_chunks(csv_file, capsys):
+    code = main(
+        [
+            str(csv_file),
+            "-c",
+            "country",
+            "--origin=country.name",
+            "--destination=iso3n",
+            "--into=country",
+            "--engine=python",
+            "--chunk-size=1",
+        ]
+    )
+    assert code == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "id,country",
+        "1,124",
+        "2,12",
+        "3,",
+        "4,",
+    ]
+
+
+def test_cli_ndjson_numeric_origin(tmp_path, capsys):
+    path = tmp_path / "input.ndjson"
+    path.write_text('{"code": 124}\n{"code": null}\n{"code": 12}\n')
+    code = main(
+        [
+            str(path),
+            "-c",
+            "code",
+            "--origin=iso3n",
+            "--destination=iso2c",
+            "--engine=python",
+        ]
+    )
+    assert code == 0
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["iso2c"] for line in lines] == ["CA", None, "DZ"]
+
+
+@pytest.mark.skipif(not _has_polars, reason="Polars not installed")
+def test_cli_parquet(csv_file, tmp_path):
+    output = tmp_path / "output.parquet"
+    code = main(
+        [
+            str(csv_file),
+            "-c",
+            "country",
+            "--origin=country.name",
+            "--destination=cown",
+            f"--output={output}",
+        ]
+    )
+    assert code == 0
+    assert pl.read_parquet(output)["cown"].to_list() == [20, 615, None, None]
+
+
+def test_cli_errors(csv_file, capsys):
+    args = [str(csv_file), "-c", "missing", "--origin=iso3c", "--destination=iso2c"]
+    assert main(args + ["--engine=python"]) == 1
+    assert "Column `missing` not found" in capsys.readouterr().err
+    assert main(args + ["--engine=python", "--output=out.parquet"]) == 1
+    assert "requires polars" in capsys.readouterr().err
@@ -0,0 +1,50 @@
+import os
+import pickle
+import sys
+
+from countrycode import clear_codelist_cache, codelist_cache_info, countrycode
+from countrycode.countrycode import prepare_codelist
+
+
+def test_default_codelist_is_shared():
+    first = prepare_codelist(None)
+    second = prepare_codelist(None, origin="iso3c", destination="iso3n")
+    assert first is second
+
+
+def test_default_codelist_skips_the_file_system(monkeypatch):
+    module = sys.modules["countrycode.countrycode"]
+    prepare_codelist(None)
+
+    def fail(path):
+        raise AssertionError(f"{path} read again")
+
+    # Only user-supplied paths are checked for changes on disk
+    monkeypatch.setattr(module, "_load_codelist_file", fail)
+    assert countrycode("CAN", "iso3c", "cown") == 20
+
+
+def test_clear_and_inspect_cache():
+    clear_codelist_cache()
+    assert codelist_cache_info() == {}
+    assert countrycode("CAN", "iso3c", "iso2c") == "CA"
+    info = codelist_cache_info()
+    assert len(info) == 1
+    (entry,) = info.values()
+    assert entry["columns"] == 624
+    assert entry["rows"] == 291
+
+
+def test_custom_pickle_reloaded_when_file_changes(tmp_path):
+    path = tmp_path / "custom.pickle"
+    with open(path, "wb") as f:
+        pickle.dump({"code": ["A"], "name": ["Alpha"]}, f)
+    assert countrycode("A", "code", "name", custom_dict=path) == "Alpha"
+    assert prepare_codelist(path) is prepare_codelist(str(path))
+
+    with open(path, "wb") as f:
+        pickle.dump({"code": ["A"], "name": ["Aleph"]}, f)
+    # Force a distinct mtime even on filesystems with coarse timestamps
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert countrycode("A", "code", "name", custom_dict=path) == "Aleph"
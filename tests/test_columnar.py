@@ -0,0 +1,55 @@
+import os
+import pickle
+
+import pytest
+
+from countrycode import countrycode
+from countrycode.columnar import ColumnarCodelist, write_columnar
+from countrycode.countrycode import prepare_codelist
+
+pkg_dir, pkg_filename = os.path.split(__file__)
+pkg_dir = os.path.dirname(pkg_dir)
+pickle_path = os.path.join(pkg_dir, "countrycode", "data", "codelist.pickle")
+
+
+def test_columnar_round_trip(tmp_path):
+    data = {
+        "code": ["A", "B", None],
+        "name": ["Alpha", "Bêta", "Gamma"],
+        "number": [1, None, 3],
+    }
+    path = tmp_path / "custom.columns"
+    write_columnar(data, path)
+
+    columns = ColumnarCodelist(path)
+    assert len(columns) == 3
+    assert columns.rows == 3
+    assert list(columns) == ["code", "name", "number"]
+    assert columns.loaded_columns() == []
+    assert columns["name"] == tuple(data["name"])
+    assert columns.loaded_columns() == ["name"]
+    assert {key: list(value) for key, value in columns.items()} == data
+    assert pickle.loads(pickle.dumps(columns))["number"] == (1, None, 3)
+
+    assert countrycode("C", "code", "number", custom_dict=path) is None
+    assert countrycode(["A", "B"], "code", "name", custom_dict=str(path)) == [
+        "Alpha",
+        "Bêta",
+    ]
+
+
+def test_columnar_rejects_other_files(tmp_path):
+    path = tmp_path / "custom.columns"
+    path.write_bytes(b"not a codelist")
+    with pytest.raises(ValueError, match="not a columnar codelist"):
+        ColumnarCodelist(path)
+
+
+def test_default_codelist_matches_pickle():
+    codelist = prepare_codelist(None)
+    assert isinstance(codelist, ColumnarCodelist)
+    with open(pickle_path, "rb") as f:
+        reference = pickle.load(f)
+    assert list(codelist) == list(reference)
+    for column in ["iso3c", "iso3n", "country.name.en.regex", "cldr.short.fr"]:
+        assert list(codelist[column]) == reference[column]
@@ -0,0 +1,50 @@
+import pickle
+
+import pytest
+
+from countrycode import Converter, countrycode
+
+
+def test_converter_scalars_and_lists():
+    to_name = Converter("iso3c", "country.name")
+    assert to_name("CAN") == "Canada"
+    assert to_name("BAD") is None
+    assert to_name(["USA", "CAN"]) == ["United States", "Canada"]
+
+    to_iso3c = Converter("country.name", "iso3c")
+    assert to_iso3c("alGeria") == "DZA"
+    assert to_iso3c("alGeria") == "DZA"
+    assert to_iso3c(["Canada", "Atlantis"]) == ["CAN", None]
+
+
+def test_converter_matches_countrycode():
+    names = ["Canada", "Democratic Republic of Vietnam", "Holland", "Atlantis"]
+    for origin, destination in [("country.name", "cowc"), ("iso3c", "iso3n")]:
+        convert = Converter(origin, destination)
+        source = names if origin == "country.name" else ["DZA", "CAN", "BAD"]
+        assert convert(source) == countrycode(source, origin, destination)
+
+
+def test_converter_as_dict():
+    mapping = Converter("iso3c", "iso3n").as_dict()
+    assert mapping["DZA"] == 12
+    assert "BAD" not in mapping
+
+    patterns = Converter("country.name", "iso3c").as_dict()
+    assert patterns["algeria"] == "DZA"
+
+
+def test_converter_pickle():
+    custom_data = {"code": ["A", "B"], "name": ["Alpha", "Beta"]}
+    for convert in [
+        Converter("country.name", "iso3c"),
+        Converter("code", "name", custom_dict=custom_data),
+    ]:
+        clone = pickle.loads(pickle.dumps(convert))
+        assert repr(clone) == repr(convert)
+        assert clone.as_dict() == convert.as_dict()
+
+
+def test_converter_validates_once():
+    with pytest.raises(ValueError, match="origin"):
+        Converter("bad", "iso3c")
@@ -74,3 +74,25 @@ def test_corner_cases_misc():
     assert countrycode("Sint Maarten", "country.name.de", "iso3c") == "SXM"
     assert countrycode("Aruba", "country.name.de", "iso3c") == "ABW"
     assert countrycode("Curaçao", "country.name.de", "iso3c") == "CUW"
+
+
+def test_corner_cases_missing_and_unhashable_inputs():
+    assert countrycode([None, "CAN", ["CAN"], "CAN"], "iso3c", "iso2c") == [
+        None,
+        "CA",
+        None,
+        "CA",
+    ]
+    assert countrycode(["Canada", None, {"a": 1}], "country.name", "iso3c") == [
+        "CAN",
+        None,
+        None,
+    ]
+
+
+def test_corner_cases_tuple_input():
+    assert countrycode(("Canada", "Canada", "Chad"), "country.name", "iso3c") == [
+        "CAN",
+        "CAN",
+        "TCD",
+    ]
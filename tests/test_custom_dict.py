@@ -1,6 +1,8 @@
+import sys
+
 import pytest
 
-from countrycode import countrycode
+from countrycode import clear_lookup_cache, countrycode
 
 try:
     import polars as pl
@@ -29,6 +31,24 @@ def test_custom_dict_as_dict():
     assert result == 2  # Note: should be converted to int
 
 
+@pytest.mark.skipif(not _has_polars, reason="Polars not installed")
+def test_polars_dataframe_snapshot_is_reused():
+    module = sys.modules["countrycode.countrycode"]
+    custom_df = pl.DataFrame({"code": ["A", "B"], "name": ["Alpha", "Beta"]})
+    snapshot = module.prepare_codelist(custom_df)
+    assert module.prepare_codelist(custom_df) is snapshot
+
+    countrycode("CAN", "iso3c", "iso2c")
+    default_keys = set(module._lookup_cache)
+    for _ in range(200):
+        assert countrycode("A", "code", "name", custom_dict=custom_df) == "Alpha"
+    # The default codelist's tables are not evicted by repeated calls
+    assert default_keys <= set(module._lookup_cache)
+
+    clear_lookup_cache(custom_df)
+    assert module.prepare_codelist(custom_df) is not snapshot
+
+
 @pytest.mark.skipif(not _has_polars, reason="Polars not installed")
 def test_custom_dict_as_polars_dataframe():
     """Test using a custom dictionary as Polars DataFrame"""
@@ -150,3 +170,43 @@ def test_custom_dict_polars_series_conversion():
 
     assert isinstance(result, pl.Series)
     assert result.to_list() == ["Alpha", "Gamma", "Beta"]
+
+
+def test_custom_dict_exact_first_match_skips_none():
+    """Test that the first row with a non-missing destination wins"""
+    custom_data = {
+        "code": ["A", "A", "B", None, "B"],
+        "name": [None, "Alpha", "Beta", "Nothing", "Bravo"],
+    }
+
+    result = countrycode(
+        ["A", "B", None, ["A"]],
+        origin="code",
+        destination="name",
+        custom_dict=custom_data,
+    )
+    assert result == ["Alpha", "Beta", None, None]
+
+
+def test_custom_dict_modified_in_place_after_invalidation():
+    """Test that clear_lookup_cache drops tables built from a mutated dict"""
+    custom_data = {
+        "code": ["A", "B"],
+        "name": ["Alpha", "Beta"],
+        "country.name.en.regex": ["^alp", "^bet"],
+    }
+    assert countrycode("B", "code", "name", custom_dict=custom_data) == "Beta"
+    assert (
+        countrycode("beta", "country.name.en.regex", "code", custom_dict=custom_data)
+        == "B"
+    )
+
+    custom_data["name"][1] = "Bravo"
+    custom_data["country.name.en.regex"][1] = "^bra"
+    clear_lookup_cache(custom_data)
+
+    assert countrycode("B", "code", "name", custom_dict=custom_data) == "Bravo"
+    assert (
+        countrycode("bravo", "country.name.en.regex", "code", custom_dict=custom_data)
+        == "B"
+    )
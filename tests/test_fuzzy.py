@@ -0,0 +1,97 @@
+import pytest
+
+from countrycode import countrycode, fuzzy_countrycode
+from countrycode.countrycode import prepare_codelist
+from countrycode.fuzzy import FuzzyIndex
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+typos = ["Cananda", "Frnace", "Tuerkiye", "Untied States", "Germny", "Phillipines"]
+
+
+def test_fuzzy_resolves_typos():
+    assert countrycode(typos, "country.name", "iso3c") == [None] * len(typos)
+    out = fuzzy_countrycode(typos, destination="iso3c")
+    assert out == ["CAN", "FRA", "TUR", "USA", "DEU", "PHL"]
+    assert fuzzy_countrycode("Cananda", destination="cown") == 20
+
+
+def test_fuzzy_scores():
+    names = ["Canada", "Cananda", "Atlantis", None, 5]
+    values, scores = fuzzy_countrycode(names, destination="iso3c", return_score=True)
+    assert values == ["CAN", "CAN", None, None, None]
+    assert scores[0] == 1.0
+    assert 0.8 <= scores[1] < 1.0
+    assert scores[2:] == [None, None, None]
+
+    value, score = fuzzy_countrycode("Atlantis", threshold=0, return_score=True)
+    assert value is not None and 0 < score < 0.8
+
+
+def test_fuzzy_agrees_with_regex_matches():
+    names = [name for name in prepare_codelist(None)["country.name.en"] if name]
+    fuzzy = fuzzy_countrycode(names, destination="iso3c")
+    regex = countrycode(names, "country.name", "iso3c")
+    for name, fuzzy_value, regex_value in zip(names, fuzzy, regex):
+        if regex_value is not None:
+            assert fuzzy_value == regex_value, name
+
+
+def test_fuzzy_other_languages():
+    assert fuzzy_countrycode("Deutschlnd", "country.name.de", "iso3c") == "DEU"
+
+
+def test_fuzzy_index_scores_candidates_only():
+    index = FuzzyIndex("country.name.en.regex", prepare_codelist(None))
+    assert "country.name.en" in index.columns
+    assert "cldr.name.fr" in index.columns
+    assert "un.name.es" in index.columns
+    row, score = index.best("Cananda")
+    assert prepare_codelist(None)["iso3c"][row] == "CAN"
+    assert index.best("") == (None, 0.0)
+    assert index.best(" ?! ") == (None, 0.0)
+
+
+def test_fuzzy_invalid_arguments():
+    with pytest.raises(ValueError, match="regex origin"):
+        fuzzy_countrycode(["CAN"], "iso3c", "iso2c")
+    with pytest.raises(ValueError, match="threshold"):
+        fuzzy_countrycode(["Cananda"], threshold=2)
+    with pytest.raises(ValueError, match="single destination"):
+        fuzzy_countrycode(["Cananda"], destination=["iso3c", "iso2c"])
+
+
+@pytest.mark.skipif(pl is None, reason="polars is not installed")
+def test_fuzzy_polars():
+    values, scores = fuzzy_countrycode(
+        pl.Series("name", typos), destination="iso3c", return_score=True
+    )
+    assert values.name == "name"
+    assert values.to_list() == ["CAN", "FRA", "TUR", "USA", "DEU", "PHL"]
+    assert scores.dtype == pl.Float64
+
+
+@pytest.mark.skipif(pd is None, reason="pandas is not installed")
+def test_fuzzy_pandas():
+    series = pd.Series(typos, index=list("abcdef"), name="name")
+    out = fuzzy_countrycode(series, destination="iso3c")
+    assert out.index.tolist() == list("abcdef")
+    assert out.tolist() == ["CAN", "FRA", "TUR", "USA", "DEU", "PHL"]
+
+
+def test_regex_matches_without_destination_are_not_fuzzy_matched():
+    # These names match a row which has no iso3c, so they must not be resolved
+    # to the most similar name of another country
+    names = ["Yemen Arab Republic", "Prussia", "Somaliland"]
+    assert countrycode(names, "country.name", "iso3c") == [None, None, None]
+    values, scores = fuzzy_countrycode(names, destination="iso3c", return_score=True)
+    assert values == [None, None, None]
+    assert scores == [None, None, None]
+    assert fuzzy_countrycode("Prussia", destination="country.name.en") == "Prussia"
@@ -0,0 +1,35 @@
+import itertools
+
+import pytest
+
+from countrycode import countrycode, iter_convert
+
+
+def test_iter_convert_matches_countrycode():
+    codes = ["DZA", "CAN", None, "BAD", "CAN", "USA", "DZA"]
+    out = iter_convert(iter(codes), "iso3c", "iso3n", chunk_size=3)
+    assert list(out) == countrycode(codes, "iso3c", "iso3n")
+
+    names = ["Canada", "alGeria", "Atlantis", None, "canada"]
+    out = iter_convert(names, "country.name", "iso3c", chunk_size=2)
+    assert list(out) == ["CAN", "DZA", None, None, "CAN"]
+
+
+def test_iter_convert_is_lazy():
+    consumed = []
+
+    def source():
+        for code in itertools.cycle(["DZA", "CAN"]):
+            consumed.append(code)
+            yield code
+
+    out = iter_convert(source(), "iso3c", "iso2c", chunk_size=4)
+    assert list(itertools.islice(out, 5)) == ["DZ", "CA", "DZ", "CA", "DZ"]
+    assert len(consumed) == 8
+
+
+def test_iter_convert_validates_eagerly():
+    with pytest.raises(ValueError, match="chunk_size"):
+        iter_convert(["DZA"], chunk_size=0)
+    with pytest.raises(ValueError, match="origin"):
+        iter_convert(["DZA"], origin="bad")
@@ -0,0 +1,83 @@
+import pytest
+
+from countrycode import countrycode, locate, take
+
+DESTINATIONS = ["iso3c", "iso3n", "country.name.de", "continent", "currency"]
+
+
+def test_locate_then_take_matches_countrycode():
+    names = ["Canada", "alGeria", "Atlantis", None, "Canada", ["unhashable"]]
+    rows = locate(names, "country.name")
+    assert rows == [42, 2, -1, -1, 42, -1]
+    for destination in DESTINATIONS:
+        assert take(rows, destination) == countrycode(
+            names, "country.name", destination
+        )
+
+    codes = ["CAN", "DZA", "BAD", None]
+    rows = locate(codes, "iso3c")
+    assert take(rows, DESTINATIONS) == countrycode(codes, "iso3c", DESTINATIONS)
+
+
+def test_scalars():
+    row = locate("Canada", "country.name")
+    assert row == locate("CAN") == 42
+    assert take(row, "iso2c") == "CA"
+    assert take(-1, "iso2c") is None
+    assert locate("BAD") == -1
+    assert locate(5, "country.name") == -1
+
+
+def test_custom_dict():
+    custom_data = {"code": ["A", "B"], "name": ["Alpha", None]}
+    rows = locate(["B", "A", "C"], "code", custom_dict=custom_data)
+    assert rows == [1, 0, -1]
+    assert take(rows, "name", custom_dict=custom_data) == [None, "Alpha", None]
+    with pytest.raises(ValueError):
+        take(rows, "missing", custom_dict=custom_data)
+
+
+def test_numpy():
+    np = pytest.importorskip("numpy")
+    rows = locate(np.array([[4, 840], [1, 276]]), "iso3n")
+    assert rows.dtype == np.intp
+    assert rows.tolist() == [[0, 270], [-1, 90]]
+    assert take(rows, "iso3c").tolist() == [["AFG", "USA"], [None, "DEU"]]
+
+    rows = locate(np.array(["Canada", "alGeria"]), "country.name")
+    assert take(rows, "iso3n").dtype == np.int64
+    assert take(rows[0], "iso3c") == "CAN"
+
+
+def test_series():
+    pd = pytest.importorskip("pandas")
+    source = pd.Series(["CAN", "BAD"], index=[5, 6], name="code")
+    rows = locate(source, "iso3c")
+    assert rows.dtype == "int64"
+    test = take(rows, "iso3n")
+    assert test.index.tolist() == [5, 6]
+    assert test.dtype == "Int64"
+    assert test.tolist() == [124, pd.NA]
+
+    pl = pytest.importorskip("polars")
+    rows = locate(pl.Series("code", ["CAN", "BAD"]), "iso3c")
+    assert rows.dtype == pl.Int64
+    test = take(rows, "country.name")
+    assert test.name == "code"
+    assert test.to_list() == ["Canada", None]
+
+
+def test_series_nulls_and_categoricals():
+    pd = pytest.importorskip("pandas")
+    source = pd.Series(["Canada", None, "Atlantis", "Canada"], dtype="category")
+    assert locate(source, "country.name").tolist() == [42, -1, -1, 42]
+    source = pd.Series([4, None, 840], dtype="Int64")
+    assert locate(source, "iso3n").tolist() == [0, -1, 270]
+
+    pl = pytest.importorskip("polars")
+    source = pl.Series("code", ["CAN", None, "BAD"], dtype=pl.Categorical)
+    rows = locate(source, "iso3c")
+    assert rows.name == "code"
+    assert rows.to_list() == [42, -1, -1]
+    rows = locate(pl.Series("code", [2, 20, None], dtype=pl.UInt8), "cown")
+    assert rows.to_list() == [270, 42, -1]
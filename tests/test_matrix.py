@@ -0,0 +1,50 @@
+import pickle
+
+import pytest
+
+from countrycode import countrycode
+from countrycode.countrycode import (
+    _MATRIX_PATH,
+    _build_exact_table,
+    _matrix_rows,
+    prepare_codelist,
+)
+from countrycode.matrix import build_matrix, code_columns
+
+codelist = prepare_codelist(None)
+
+with open(_MATRIX_PATH, "rb") as f:
+    shipped = pickle.load(f)
+
+
+def test_shipped_matrix_matches_the_codelist():
+    assert shipped == build_matrix(codelist)
+    assert sorted(shipped["origins"]) == sorted(code_columns(codelist))
+
+
+@pytest.mark.parametrize("origin", sorted(shipped["origins"]))
+def test_matrix_converts_like_the_exact_table(origin):
+    assert _matrix_rows(origin, codelist) is not None
+    values = list(codelist[origin]) + ["BAD", None, -1, ["unhashable"]]
+    for destination in ["iso3c", "iso3n", "country.name.en", "continent"]:
+        table = _build_exact_table(origin, destination, codelist)
+        expected = [
+            table.get(value) if isinstance(value, (str, int)) else None
+            for value in values
+        ]
+        assert countrycode(values, origin, destination) == expected
+
+
+def test_matrix_ignored_for_other_codelists():
+    custom_data = {"iso3c": ["CAN", "FRA"], "code": ["A", "B"]}
+    assert _matrix_rows("iso3c", custom_data) is None
+    assert countrycode(["FRA", "CAN"], "iso3c", "code", custom_dict=custom_data) == [
+        "B",
+        "A",
+    ]
+
+
+def test_repeated_values_are_left_out():
+    custom_data = {"iso3c": ["CAN", "CAN", "FRA"], "cown": [None, 20, 220]}
+    assert list(build_matrix(custom_data)["origins"]) == ["cown"]
+    assert countrycode("CAN", "iso3c", "cown", custom_dict=custom_data) == 20
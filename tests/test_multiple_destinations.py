@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from countrycode import acountrycode, countrycode
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+destinations = ["iso3c", "iso2c", "cown", "region", "continent"]
+
+
+def test_multiple_destinations_match_single_calls():
+    names = ["Canada", "Algeria", "Atlantis", None, "Yugoslavia", "Canada"]
+    out = countrycode(names, "country.name", destinations)
+    assert list(out) == destinations
+    for destination in destinations:
+        assert out[destination] == countrycode(names, "country.name", destination)
+
+    codes = ["CAN", "DZA", "BAD"]
+    out = countrycode(codes, "iso3c", ["country.name", "iso3n"])
+    assert out == {
+        "country.name.en": ["Canada", "Algeria", None],
+        "iso3n": [124, 12, None],
+    }
+
+
+def test_multiple_destinations_scalar():
+    assert countrycode("DZA", "iso3c", ["iso2c", "cown"]) == {
+        "iso2c": "DZ",
+        "cown": 615,
+    }
+
+
+def test_multiple_destinations_skip_missing_rows():
+    custom_data = {
+        "code": ["A", "A", "B"],
+        "name": ["Alpha", "Aleph", "Beta"],
+        "number": [None, "2", "3"],
+    }
+    out = countrycode(["A", "B"], "code", ["name", "number"], custom_dict=custom_data)
+    assert out == {"name": ["Alpha", "Beta"], "number": [2, 3]}
+
+
+def test_multiple_destinations_validation():
+    with pytest.raises(ValueError, match="must contain the destination column 'bad'"):
+        countrycode("DZA", "iso3c", ["iso2c", "bad"])
+
+
+@pytest.mark.skipif(pl is None, reason="Polars not installed")
+def test_multiple_destinations_polars():
+    source = pl.Series("name", ["Canada", None, "Algeria"])
+    out = countrycode(source, "country.name", ["iso3c", "cown"])
+    assert isinstance(out, pl.DataFrame)
+    assert out.columns == ["iso3c", "cown"]
+    assert out["cown"].dtype == pl.Int64
+    assert out.rows() == [("CAN", 20), (None, None), ("DZA", 615)]
+
+    lf = pl.LazyFrame({"name": ["Canada", None, "Algeria"]})
+    out = lf.with_columns(
+        countrycode(pl.col("name"), "country.name", ["iso3c", "cown"])
+    ).collect()
+    assert out.columns == ["name", "iso3c", "cown"]
+    assert out["iso3c"].to_list() == ["CAN", None, "DZA"]
+
+
+@pytest.mark.skipif(pd is None, reason="pandas not installed")
+def test_multiple_destinations_pandas():
+    source = pd.Series(["DZA", None, "CAN"], index=[3, 4, 5])
+    out = countrycode(source, "iso3c", ["iso2c", "iso3n"])
+    assert isinstance(out, pd.DataFrame)
+    assert out.index.tolist() == [3, 4, 5]
+    assert out["iso3n"].dtype == "Int64"
+    assert out["iso2c"].tolist() == ["DZ", pd.NA, "CA"]
+
+
+def test_repeated_destinations_are_converted_once():
+    out = countrycode(["CAN", "BAD"], "iso3c", ["iso2c", "iso2c"])
+    assert out == {"iso2c": ["CA", None]}
+
+    out = countrycode("CAN", "iso3c", ["country.name", "country.name.en", "iso2c"])
+    assert out == {"country.name.en": "Canada", "iso2c": "CA"}
+
+    source = ["CAN", "BAD"] * 1000
+    out = asyncio.run(acountrycode(source, "iso3c", ["iso2c", "iso2c"]))
+    assert out == {"iso2c": ["CA", None] * 1000}
+
+
+@pytest.mark.skipif(pl is None, reason="polars not installed")
+def test_multiple_destinations_polars_mixed_types():
+    custom_data = {"code": ["A", "B"], "mix": [1, "x"], "name": ["Alpha", "Beta"]}
+    source = pl.Series("code", ["A", "B", None])
+    out = countrycode(source, "code", ["mix", "name"], custom_dict=custom_data)
+    assert out["mix"].dtype == pl.Object
+    assert out["mix"].to_list() == [1, "x", None]
+    assert out["name"].to_list() == ["Alpha", "Beta", None]
+
+    out = pl.DataFrame({"code": source}).with_columns(
+        countrycode(pl.col("code"), "code", ["mix", "name"], custom_dict=custom_data)
+    )
+    assert out.columns == ["code", "mix", "name"]
+    assert out["mix"].to_list() == [1, "x", None]
+    assert out["name"].to_list() == ["Alpha", "Beta", None]
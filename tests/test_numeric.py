@@ -0,0 +1,85 @@
+import pytest
+
+from countrycode import countrycode
+
+np = pytest.importorskip("numpy")
+
+NUMERIC_ORIGINS = ["cown", "iso3n", "un", "imf", "p4n", "gwn", "vdem"]
+
+
+@pytest.mark.parametrize("origin", NUMERIC_ORIGINS)
+@pytest.mark.parametrize("destination", ["iso3c", "cown", "iso3n"])
+def test_numpy_integers_match_list_path(origin, destination):
+    codes = np.array([-5, 0, 2, 4, 840, 999999, 1 << 40] + list(range(1000)))
+    test = countrycode(codes, origin, destination)
+    assert isinstance(test, np.ndarray)
+    assert test.shape == codes.shape
+    assert test.tolist() == countrycode(codes.tolist(), origin, destination)
+
+
+def test_numpy_integers_keep_integer_dtype():
+    test = countrycode(np.array([4, 840, 276]), "iso3n", "cown")
+    assert test.dtype == np.int64
+    assert test.tolist() == [700, 2, 255]
+
+    # A missing code needs None, hence an object array
+    test = countrycode(np.array([4, 1]), "iso3n", "cown")
+    assert test.dtype == object
+    assert test.tolist() == [700, None]
+
+    test = countrycode(
+        np.array([[4, 840], [1, 276]], dtype=np.uint16), "iso3n", "iso3c"
+    )
+    assert test.tolist() == [["AFG", "USA"], [None, "DEU"]]
+
+
+def test_negative_custom_codes_fall_back():
+    custom = {"code": [-1, 2], "name": ["Minus", "Two"]}
+    test = countrycode(np.array([-1, 2, 3]), "code", "name", custom_dict=custom)
+    assert list(test) == ["Minus", "Two", None]
+
+
+@pytest.mark.parametrize("origin", NUMERIC_ORIGINS)
+@pytest.mark.parametrize("destination", ["iso3c", "iso3n"])
+def test_pandas_integers_match_factorized_path(origin, destination):
+    pd = pytest.importorskip("pandas")
+    source = pd.Series([4, 2, 840, -3, 2, 1 << 40], index=list("abcdef"), name="n")
+    test = countrycode(source, origin, destination)
+    expected = countrycode(source.astype(object), origin, destination)
+    pd.testing.assert_series_equal(test, expected)
+
+    source = pd.Series([4, None, 840], dtype="Int64")
+    expected = countrycode(source.astype(object), origin, destination)
+    pd.testing.assert_series_equal(countrycode(source, origin, destination), expected)
+
+
+def test_numpy_strings_keep_shape_and_dtype():
+    source = np.array([["Canada", "alGeria"], ["Canada", "France"]])
+    test = countrycode(source, "country.name", "iso3c")
+    assert test.shape == (2, 2)
+    assert test.dtype.kind == "U"
+    assert test.tolist() == [["CAN", "DZA"], ["CAN", "FRA"]]
+
+    test = countrycode(np.array(["CAN", "BAD"]), "iso3c", "iso3n")
+    assert test.dtype == object
+    assert test.tolist() == [124, None]
+
+
+def test_numpy_object_arrays():
+    # Strings mixed with None cannot be sorted by np.unique
+    source = np.array(["CAN", None, "DZA", "CAN"], dtype=object)
+    test = countrycode(source, "iso3c", "country.name")
+    assert test.dtype == object
+    assert test.tolist() == ["Canada", None, "Algeria", "Canada"]
+    assert countrycode(np.array([], dtype=object), "iso3c", "iso3n").shape == (0,)
+
+
+def test_numpy_multiple_destinations():
+    source = np.array(["CAN", None, "DZA"], dtype=object)
+    test = countrycode(source, "iso3c", ["iso3n", "country.name"])
+    assert test["iso3n"].tolist() == [124, None, 12]
+    assert test["country.name.en"].tolist() == ["Canada", None, "Algeria"]
+
+    test = countrycode(np.array(["CAN", "DZA"]), "iso3c", ["iso3n", "country.name"])
+    assert test["iso3n"].dtype == np.int64
+    assert test["country.name.en"].dtype.kind == "U"
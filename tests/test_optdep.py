@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 from countrycode import countrycode
 
 try:
@@ -72,3 +75,17 @@ def test_optdep():
     ref = out_cctld[0]
     assert isinstance(test, str)
     assert test == ref
+
+
+def test_import_is_lazy():
+    code = (
+        "import sys, countrycode; "
+        "assert 'polars' not in sys.modules and 'pandas' not in sys.modules; "
+        "assert 'asyncio' not in sys.modules; "
+        "assert 'concurrent.futures' not in sys.modules; "
+        "assert countrycode.countrycode('CAN', 'iso3c', 'iso2c') == 'CA'; "
+        "assert 'polars' not in sys.modules and 'pandas' not in sys.modules; "
+        "from countrycode import codelist; "
+        "assert codelist['iso3c'][:2] == ['AFG', 'ALB']"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,44 @@
+import pytest
+
+from countrycode import countrycode
+
+try:
+    import pandas as pd
+
+    _has_pandas = True
+except ImportError:
+    _has_pandas = False
+
+if not _has_pandas:
+    pytest.skip("Test requires pandas installation", allow_module_level=True)
+
+
+def test_series_keeps_index_name_and_nulls():
+    source = pd.Series(["CAN", None, "BAD", "DZA"], index=[10, 11, 12, 13], name="code")
+
+    test = countrycode(source, "iso3c", "iso3n")
+    assert test.name == "code"
+    assert test.index.tolist() == [10, 11, 12, 13]
+    assert test.dtype == "Int64"
+    assert test.tolist() == [124, pd.NA, pd.NA, 12]
+
+    test = countrycode(source, "iso3c", "country.name")
+    assert test.dtype == "string"
+    assert test.tolist() == ["Canada", pd.NA, pd.NA, "Algeria"]
+
+
+def test_series_regex_and_categorical():
+    source = pd.Series(["Canada", "alGeria", None, "Canada", "Atlantis"])
+    expected = ["CAN", "DZA", pd.NA, "CAN", pd.NA]
+    assert countrycode(source, "country.name", "iso3c").tolist() == expected
+
+    source = source.astype("category")
+    assert countrycode(source, "country.name", "iso3c").tolist() == expected
+
+
+def test_series_mixed_destination_is_object():
+    custom_data = {"code": ["A", "B"], "value": ["1", "x"]}
+    source = pd.Series(["B", "A", "C"])
+    test = countrycode(source, "code", "value", custom_dict=custom_data)
+    assert test.dtype == object
+    assert test.tolist() == ["x", 1, None]
@@ -0,0 +1,98 @@
+import asyncio
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from countrycode import (
+    acountrycode,
+    clear_lookup_cache,
+    codelist,
+    countrycode,
+    locate,
+)
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+
+def names():
+    # More distinct strings than the parallel threshold, with a few misses
+    base = countrycode(codelist["iso3c"], "iso3c", "country.name")
+    out = [name for name in base if name is not None]
+    out += [f"{name} ({i})" for i in range(4) for name in out]
+    out += ["Atlantis", None, "Canada"]
+    return out
+
+
+def test_n_jobs_matches_serial():
+    sourcevar = names()
+    assert len(set(sourcevar)) > 1000
+    serial = countrycode(sourcevar, "country.name", "iso3c")
+    assert countrycode(sourcevar, "country.name", "iso3c", n_jobs=2) == serial
+    assert countrycode(sourcevar, "country.name", "iso3c", n_jobs=-1) == serial
+
+
+def test_executor_matches_serial():
+    sourcevar = names()
+    serial = countrycode(sourcevar, "country.name", "cown")
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        out = countrycode(sourcevar, "country.name", "cown", executor=executor)
+        assert out == serial
+        # The same workers are reused for another destination
+        out = countrycode(sourcevar, "country.name", "iso2c", executor=executor)
+        assert out == countrycode(sourcevar, "country.name", "iso2c")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        out = countrycode(sourcevar, "country.name", "cown", executor=executor)
+        assert out == serial
+
+
+def test_parallel_multiple_destinations():
+    sourcevar = names()
+    destinations = ["iso3c", "cown", "continent"]
+    serial = countrycode(sourcevar, "country.name", destinations)
+    assert countrycode(sourcevar, "country.name", destinations, n_jobs=2) == serial
+
+
+@pytest.mark.skipif(pl is None, reason="polars is not installed")
+def test_parallel_polars():
+    sourcevar = pl.Series("name", names())
+    serial = countrycode(sourcevar, "country.name", "iso3c")
+    out = countrycode(sourcevar, "country.name", "iso3c", n_jobs=2)
+    assert out.to_list() == serial.to_list()
+
+
+@pytest.mark.parametrize("n_jobs", [0, -7, "x", 2.0, True])
+def test_invalid_n_jobs(n_jobs):
+    with pytest.raises(ValueError, match="n_jobs"):
+        countrycode(names(), "country.name", "iso3c", n_jobs=n_jobs)
+    # Rejected even when no worker process would be used
+    with pytest.raises(ValueError, match="n_jobs"):
+        countrycode("CAN", "iso3c", "iso2c", n_jobs=n_jobs)
+    with pytest.raises(ValueError, match="n_jobs"):
+        locate(["Canada"], "country.name", n_jobs=n_jobs)
+    with pytest.raises(ValueError, match="n_jobs"):
+        asyncio.run(acountrycode(["CAN"], "iso3c", "iso2c", n_jobs=n_jobs))
+
+
+def test_worker_matchers_are_keyed_by_content_and_bounded():
+    module = sys.modules["countrycode.countrycode"]
+    for i in range(40):
+        table = ((f"^code{i}$", re.IGNORECASE, i),)
+        key = module._digest(table)
+        assert module._match_in_worker(key, table, [f"CODE{i}", "code"]) == [i, None]
+    assert len(module._worker_matchers) <= module._WORKER_MATCHERS_SIZE
+
+    # Rebuilding a matcher after the lookup cache is cleared reuses the same entry
+    clear_lookup_cache()
+    sourcevar = names()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = countrycode(sourcevar, "country.name", "iso3c", executor=executor)
+        size = len(module._worker_matchers)
+        clear_lookup_cache()
+        second = countrycode(sourcevar, "country.name", "iso3c", executor=executor)
+    assert first == second
+    assert len(module._worker_matchers) == size
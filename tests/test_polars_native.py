@@ -0,0 +1,84 @@
+import pytest
+
+from countrycode import countrycode
+
+try:
+    import polars as pl
+
+    _has_polars = True
+except ImportError:
+    _has_polars = False
+
+if not _has_polars:
+    pytest.skip("Test requires polars installation", allow_module_level=True)
+
+
+def test_series_keeps_name_nulls_and_dtype():
+    source = pl.Series("code", ["CAN", None, "BAD", "DZA"])
+
+    test = countrycode(source, "iso3c", "iso3n")
+    assert test.name == "code"
+    assert test.dtype == pl.Int64
+    assert test.to_list() == [124, None, None, 12]
+
+    test = countrycode(source, "iso3c", "country.name")
+    assert test.dtype == pl.String
+    assert test.to_list() == ["Canada", None, None, "Algeria"]
+
+
+def test_series_integer_origin():
+    source = pl.Series("iso3n", [12, 124, None], dtype=pl.Int32)
+    test = countrycode(source, "iso3n", "iso3c")
+    assert test.name == "iso3n"
+    assert test.to_list() == ["DZA", "CAN", None]
+
+
+def test_series_regex_and_categorical():
+    source = pl.Series("name", ["Canada", "alGeria", None, "Canada", "Atlantis"])
+    expected = ["CAN", "DZA", None, "CAN", None]
+    assert countrycode(source, "country.name", "iso3c").to_list() == expected
+
+    source = source.cast(pl.Categorical)
+    assert countrycode(source, "country.name", "iso3c").to_list() == expected
+
+
+def test_expression_in_lazy_frame():
+    lf = pl.LazyFrame(
+        {"name": ["France", "Germany", None], "iso3c": ["FRA", "DEU", None]}
+    )
+    out = lf.with_columns(
+        from_name=countrycode(pl.col("name"), "country.name", "iso3c"),
+        from_code=countrycode(pl.col("iso3c"), "iso3c", "cown"),
+    ).collect()
+    assert out["from_name"].to_list() == ["FRA", "DEU", None]
+    assert out["from_code"].dtype == pl.Int64
+    assert out["from_code"].to_list() == [220, 255, None]
+
+
+def test_series_unsupported_dtype_falls_back():
+    source = pl.Series("code", [12.0, 124.0])
+    assert countrycode(source, "iso3n", "iso3c").to_list() == ["DZA", "CAN"]
+
+
+@pytest.mark.parametrize("dtype", ["Int8", "UInt8", "Int16", "UInt64"])
+def test_series_narrow_integer_dtypes(dtype):
+    source = pl.Series("code", [2, 20, None], dtype=getattr(pl, dtype))
+    test = countrycode(source, "cown", "iso3c")
+    assert test.name == "code"
+    assert test.to_list() == ["USA", "CAN", None]
+
+    test = pl.DataFrame({"code": source}).select(
+        countrycode(pl.col("code"), "cown", "iso3c")
+    )
+    assert test["code"].to_list() == ["USA", "CAN", None]
+
+
+def test_series_keys_of_another_type_fall_back():
+    # Float codes compare equal to the integers of the Series
+    custom_data = {"n": [1.0, 2.0], "s": ["a", "b"]}
+    source = pl.Series("n", [1, 2, None])
+    test = countrycode(source, "n", "s", custom_dict=custom_data)
+    assert test.to_list() == ["a", "b", None]
+    assert test.to_list() == countrycode(
+        [1, 2, None], "n", "s", custom_dict=custom_data
+    )
@@ -0,0 +1,80 @@
+import pytest
+
+from countrycode.countrycode import (
+    _RegexMatcher,
+    _regex_matcher,
+    _name_key,
+    _regex_table,
+    prepare_codelist,
+)
+
+codelist = prepare_codelist(None)
+
+# Names in many languages and spellings, most of which are not matched by a
+# given language's regexes, plus strings that exercise case folding.
+columns = [
+    column
+    for column in codelist
+    if column.startswith(("country.name.", "un.name.", "iso.name."))
+    and not column.endswith(".regex")
+] + ["cow.name", "p4.name", "vdem.name"]
+columns += [f"cldr.short.{language}" for language in ("en", "de", "fr", "it", "es")]
+names = sorted(
+    {value for column in columns for value in codelist[column] if value is not None}
+    | {"", "KOREA", "Korea", "Ruſſia", "TÜRKİYE", "  Chad  "}
+)
+
+
+def serial_match(table, string):
+    for regex, value in table:
+        if regex.search(string):
+            return value
+    return None
+
+
+@pytest.mark.parametrize("language", ["en", "de", "fr", "it"])
+def test_matcher_agrees_with_serial_first_match(language):
+    table = _regex_table(f"country.name.{language}.regex", "iso3c", codelist)
+    matcher = _RegexMatcher(table)
+    for name in names:
+        assert matcher.match(name) == serial_match(table, name), name
+
+
+def test_matcher_patterns_without_literals():
+    table = _regex_table(
+        "country.name.en.regex",
+        "name",
+        {
+            "country.name.en.regex": ["^.{3}$", "^(?!x).*land", "\\d+"],
+            "name": [1, 2, 3],
+        },
+    )
+    matcher = _RegexMatcher(table)
+    assert matcher.always == (0, 2)
+    assert matcher.match("abc") == 1
+    assert matcher.match("iceland") == 2
+    assert matcher.match("xland 12") == 3
+    assert matcher.match("xland") is None
+
+
+@pytest.mark.parametrize("language", ["en", "de", "fr", "it"])
+@pytest.mark.parametrize("destination", ["iso3c", "cown", "vdem"])
+def test_name_shortcut_agrees_with_matcher(language, destination):
+    origin = f"country.name.{language}.regex"
+    matcher = _regex_matcher(origin, destination, codelist)
+    # Canonical names are resolved without regexes, unless the first row they
+    # match has no value for the destination
+    canonical = [
+        name
+        for name, value in zip(
+            codelist[f"country.name.{language}"], codelist[destination]
+        )
+        if name is not None and value is not None
+    ]
+    hits = [name for name in canonical if _name_key(name) in matcher.shortcut]
+    assert len(hits) > 0.95 * len(canonical)
+    # The matcher without shortcut agrees with the serial loop, see above
+    reference = _RegexMatcher(_regex_table(origin, destination, codelist))
+    for name in names:
+        for variant in (name, name.upper(), name.casefold(), f" {name}"):
+            assert matcher.match(variant) == reference.match(variant), variant
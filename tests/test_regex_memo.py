@@ -0,0 +1,83 @@
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from countrycode import clear_lookup_cache, countrycode, set_regex_memo
+from countrycode.countrycode import _RegexMatcher
+
+
+@pytest.fixture
+def memo(tmp_path):
+    memo = set_regex_memo(tmp_path / "memo.sqlite")
+    yield memo
+    set_regex_memo(None)
+
+
+def test_memo_serves_stored_resolutions(memo, monkeypatch):
+    names = ["Korea, Rep.", "Cote d'Ivoire ", "Atlantis", None, "Korea, Rep."]
+    expected = ["KOR", "CIV", None, None, "KOR"]
+    assert countrycode(names, "country.name", "iso3c") == expected
+    assert len(memo) == 3
+
+    # Stored resolutions, including misses, are not matched again
+    def fail(self, string):
+        raise AssertionError(f"matched {string!r}")
+
+    monkeypatch.setattr(_RegexMatcher, "match", fail)
+    assert countrycode(names, "country.name", "iso3c") == expected
+    assert countrycode("Korea, Rep.", "country.name", "iso3c") == "KOR"
+    with pytest.raises(AssertionError, match="Canada"):
+        countrycode("Canada", "country.name", "iso3c")
+
+
+def test_memo_keeps_output_types(memo):
+    assert countrycode(["Canada", "France"], "country.name", "cown") == [20, 220]
+    assert countrycode(["Canada", "France"], "country.name", "cown") == [20, 220]
+    memo.clear()
+    assert len(memo) == 0
+
+
+def test_memo_is_shared_between_processes(memo):
+    code = (
+        "import sys; from countrycode import countrycode, set_regex_memo; "
+        "set_regex_memo(sys.argv[1]); "
+        "print(countrycode('Korea, Rep.', 'country.name', 'iso2c'))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code, memo.path],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert out.stdout.strip() == "KR"
+    assert len(memo) == 1
+    assert countrycode("Korea, Rep.", "country.name", "iso2c") == "KR"
+
+
+def test_memo_invalidated_when_codelist_changes(memo, tmp_path):
+    path = tmp_path / "codelist.pickle"
+    data = {"country.name.en.regex": ["^alp", "^bet"], "code": ["A", "B"]}
+    with open(path, "wb") as f:
+        pickle.dump(data, f)
+    assert countrycode("alpha", "country.name.en.regex", "code", path) == "A"
+    assert len(memo) == 1
+
+    data["code"] = ["Z", "B"]
+    with open(path, "wb") as f:
+        pickle.dump(data, f)
+    assert countrycode("alpha", "country.name.en.regex", "code", path) == "Z"
+    assert len(memo) == 2
+
+    # Mutated custom dicts are only seen after invalidation, with or without memo
+    custom_data = {"country.name.en.regex": ["^alp"], "code": ["A"]}
+    assert countrycode("alpha", "country.name.en.regex", "code", custom_data) == "A"
+    custom_data["code"][0] = "Y"
+    clear_lookup_cache(custom_data)
+    assert countrycode("alpha", "country.name.en.regex", "code", custom_data) == "Y"
+
+
+def test_memo_disabled():
+    assert set_regex_memo(None) is None
+    assert countrycode("Canada", "country.name", "iso3c") == "CAN"
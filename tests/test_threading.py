@@ -0,0 +1,125 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from countrycode import (
+    Converter,
+    clear_codelist_cache,
+    clear_lookup_cache,
+    codelist,
+    countrycode,
+)
+from countrycode.countrycode import FrozenCodelist, prepare_codelist
+
+free_threading = hasattr(sys, "_is_gil_enabled") and not sys._is_gil_enabled()
+
+names = [name for name in codelist["country.name.en"] if name is not None]
+codes = [code for code in codelist["iso3c"] if code is not None]
+
+
+def run_threads(target, n_threads):
+    barrier = threading.Barrier(n_threads)
+    errors = []
+
+    def worker(index):
+        try:
+            barrier.wait()
+            target(index)
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_codelists_are_read_only():
+    custom_data = {"code": ["A", "B"], "name": ["Alpha", "Beta"]}
+    frozen = prepare_codelist(custom_data)
+    assert isinstance(frozen, FrozenCodelist)
+    assert frozen["name"] == ("Alpha", "Beta")
+    assert prepare_codelist(custom_data) is frozen
+    with pytest.raises(TypeError):
+        frozen["name"] = ["Gamma"]
+    with pytest.raises(AttributeError):
+        frozen["name"].append("Gamma")
+    with pytest.raises(TypeError):
+        prepare_codelist(None)["iso3c"][0] = "XXX"
+
+    # The public dict is a copy, which conversions do not read
+    codelist["iso3c"][0] = "XXX"
+    try:
+        assert countrycode("AFG", "iso3c", "iso2c") == "AF"
+    finally:
+        codelist["iso3c"][0] = "AFG"
+
+    # The snapshot is unaffected by later changes to the dict
+    custom_data["name"][0] = "Gamma"
+    assert countrycode("A", "code", "name", custom_dict=custom_data) == "Alpha"
+    clear_lookup_cache(custom_data)
+    assert countrycode("A", "code", "name", custom_dict=custom_data) == "Gamma"
+
+
+def test_concurrent_conversions_match_serial():
+    custom_data = {"code": codes, "name": [f"name {code}" for code in codes]}
+    expected = {
+        "regex": countrycode(names, "country.name", "iso3c"),
+        "exact": countrycode(codes, "iso3c", "cown"),
+        "custom": countrycode(codes, "code", "name", custom_dict=custom_data),
+    }
+    converter = Converter("country.name", "iso2c")
+    expected["converter"] = [converter(name) for name in names]
+
+    results = []
+
+    def convert(index):
+        for i in range(20):
+            # Writers race with readers, which must never see a partial table
+            if index == 0 and i % 5 == 0:
+                clear_codelist_cache()
+                clear_lookup_cache()
+            results.append(
+                {
+                    "regex": countrycode(names, "country.name", "iso3c"),
+                    "exact": countrycode(codes, "iso3c", "cown"),
+                    "custom": countrycode(
+                        codes, "code", "name", custom_dict=custom_data
+                    ),
+                    "converter": [converter(name) for name in names],
+                }
+            )
+
+    run_threads(convert, 8)
+    assert len(results) == 160
+    assert all(result == expected for result in results)
+
+
+@pytest.mark.skipif(not free_threading, reason="requires a free-threaded build")
+@pytest.mark.skipif((os.cpu_count() or 1) < 4, reason="requires 4 CPUs")
+def test_read_throughput_scales_with_threads():
+    converter = Converter("iso3c", "country.name")
+    sourcevar = codes * 20
+    countrycode(sourcevar, "iso3c", "cown")
+
+    def read(index):
+        for _ in range(200):
+            countrycode(sourcevar, "iso3c", "cown")
+            for code in codes:
+                converter(code)
+
+    def elapsed(n_threads):
+        start = time.perf_counter()
+        run_threads(read, n_threads)
+        return time.perf_counter() - start
+
+    single = min(elapsed(1) for _ in range(3))
+    parallel = min(elapsed(4) for _ in range(3))
+    # Four threads do four times the work; with no lock on the read path this
+    # takes about as long as one thread, allowing generous scheduling noise
+    assert parallel < 2 * single